@@ -8,7 +8,19 @@ from . import exceptions
 from . import rules
 from . import utils
 from . import abc
+from . import lazy
+from . import coercers
+from . import plan
+from . import serialization
+from . import codegen
+from . import batch
+from . import streaming
+from . import columnar
+from . import profiling
 from . import types
+from . import linking
+
+from .linking import link, warmup
 
 def start():
     try:
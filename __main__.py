@@ -1,3 +1,9 @@
+import sys
+
+if len(sys.argv) > 1 and sys.argv[1] == 'bench':
+    from .benchmarks import main
+    sys.exit(main(sys.argv[2:]))
+
 from .exceptions import ValidationError
 from .types import Outpost, OutpostProvider
 from typing import Iterable, Optional
@@ -1,11 +1,14 @@
+import inspect
+import threading
+from collections import OrderedDict
 from typing import Tuple, TypeVar, Union, List, Dict, Any, Iterable, Callable
-from typing import Generic, Type
-from dataclasses import dataclass
+from typing import Generic
+from dataclasses import dataclass, field
 
 from .rules import AND, NoRequirements, Require, Rule
 from .utils import ModelField
 from .classproperty import classproperty
-from .exceptions import AbstractError, NoPromisedValidator
+from .exceptions import AbstractError, NoPromisedValidator, ValidationError
 
 
 @dataclass
@@ -13,6 +16,10 @@ class Combinator:
     fields: Iterable[ModelField]
     method: Callable[[Any], None]
 
+    @property
+    def is_async(self) -> bool:
+        return inspect.iscoroutinefunction(self.method)
+
     def combine(self, dataset):
         values = list()
         for field in self.fields:
@@ -23,19 +30,121 @@ class Combinator:
         else:
             self.method(*values)
 
+    async def acombine(self, dataset):
+        values = list()
+        for field in self.fields:
+            if not (field in dataset.keys()):
+                break
+            else:
+                values.append(dataset[field])
+        else:
+            result = self.method(*values)
+            if inspect.isawaitable(result):
+                await result
+
+
+@dataclass(frozen=True)
+class CacheInfo:
+    hits: int
+    misses: int
+    evictions: int
+    size: int
+    maxsize: int
+
+
+def _copy_error(error: ValidationError) -> ValidationError:
+    # cached error is raised as a copy, so tracebacks of concurrent validations are not mixed up
+    result = error.__class__.__new__(error.__class__, *error.args)
+    result.__dict__.update(error.__dict__)
+    return result
+
+
+class ValidatorCache:
+    # bounded LRU of validator outcomes: results and validation errors. values are keyed with their types,
+    # so 1, 1.0 and True are cached separately. unhashable values are not cached
+    def __init__(self, maxsize: int) -> None:
+        self.maxsize = maxsize
+        self.entries: OrderedDict = OrderedDict()
+        self.lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def __call__(self, method: Callable[[Any], Any], value: Any) -> Any:
+        try:
+            key = (value.__class__, value)
+            hash(key)
+        except TypeError:
+            return method(value)
+
+        with self.lock:
+            outcome = self.entries.get(key)
+            if outcome is not None:
+                self.hits += 1
+                self.entries.move_to_end(key)
+            else:
+                self.misses += 1
+        if outcome is None:
+            # method is called without lock, other exceptions are not cached
+            try:
+                outcome = (True, method(value))
+            except ValidationError as e:
+                outcome = (False, e)
+            with self.lock:
+                if key not in self.entries and len(self.entries) >= self.maxsize:
+                    self.entries.popitem(last=False)
+                    self.evictions += 1
+                self.entries[key] = outcome
+
+        if outcome[0]:
+            return outcome[1]
+        raise _copy_error(outcome[1])
+
+    def info(self) -> CacheInfo:
+        with self.lock:
+            return CacheInfo(self.hits, self.misses, self.evictions, len(self.entries), self.maxsize)
+
+    def clear(self):
+        with self.lock:
+            self.entries.clear()
+            self.hits = self.misses = self.evictions = 0
+
 
 @dataclass
 class Validator:
     method: Callable[[Any], Any] = None
     validator: 'ABCOutpost' = None
     check_result_type: bool = True
+    cache: ValidatorCache = None
+    # arrays of nested models are validated on access
+    lazy: bool = False
+    # coercers built for this validator by annotation
+    coercers: Dict[Any, Any] = field(default_factory=dict, init=False, repr=False, compare=False)
+
+    @property
+    def is_async(self) -> bool:
+        return inspect.iscoroutinefunction(self.method)
 
     def validate(self, value):
-        if self.method:
+        if self.cache is not None:
+            return self.cache(self.method, value)
+        elif self.method:
             return self.method(value)
         else:
             return self.validator.validate(value)
 
+    async def avalidate(self, value):
+        if self.cache is not None:
+            # async methods are not cached, so cached result is never awaitable
+            return self.cache(self.method, value)
+        elif self.method:
+            result = self.method(value)
+            if inspect.isawaitable(result):
+                result = await result
+            return result
+        else:
+            return await self.validator.avalidate(value)
+
 
 TOriginalModel = TypeVar('TOriginalModel')
 
@@ -50,6 +159,7 @@ class ConfigurationFieldset:
         self.__missing_value = _EXCLUDE_MISSING
         self.__raise_readonly = None
         self.__raise_unnecessary = None
+        self.__codegen = None
         self.__readonly = list()
         self.__defaults = dict()
         self.__validators = dict()
@@ -62,6 +172,7 @@ class ConfigurationFieldset:
     __missing_value: Any = _EXCLUDE_MISSING
     __raise_readonly:bool = None
     __raise_unnecessary:bool = None
+    __codegen:bool = None
     __readonly: List[ModelField] = None
     __defaults: Dict[ModelField, Any] = None
     __validators: Dict[ModelField, 'Validator'] = None
@@ -102,6 +213,14 @@ class ConfigurationFieldset:
     def raise_unnecessary(self, value:bool):
         self.__raise_unnecessary = value    
 
+    @property
+    def codegen(self) -> bool:
+        return self.__codegen
+
+    @codegen.setter
+    def codegen(self, value:bool):
+        self.__codegen = value
+
     @property
     def readonly(self) -> List[ModelField]:
         return self.__readonly
@@ -157,6 +276,7 @@ class ConfigurationFieldset:
         
         self.__raise_readonly = child.raise_readonly or self.raise_readonly or False
         self.__raise_unnecessary = child.raise_unnecessary or self.raise_unnecessary or False
+        self.__codegen = child.codegen or self.codegen or False
         self.__missing_value = child.missing_value if not (child.missing_value is _EXCLUDE_MISSING) else self.missing_value
         self.__readonly = [*self.__readonly, *child.readonly]
         self.__defaults = {**self.__defaults, **child.defaults}
@@ -219,6 +339,14 @@ class ROConfiguration(ConfigurationFieldset):
     def raise_unnecessary(self, _):
         raise AttributeError('can`t set attribute')
 
+    @property
+    def codegen(self) -> bool:
+        return super().codegen
+
+    @codegen.setter
+    def codegen(self, _):
+        raise AttributeError('can`t set attribute')
+
     @property
     def readonly(self) -> Tuple[ModelField]:
         return tuple(super().readonly)
@@ -283,7 +411,7 @@ class GenericValidatorProvider(RWConfiguration, Generic[TOriginalModel]):
     def require(self, expression:Union[Rule, ModelField]):
         ...
 
-    def validator(self, field:ModelField, validator:'ABCOutpost' = None, check_result_type:bool = True):
+    def validator(self, field:ModelField, validator:'ABCOutpost' = None, check_result_type:bool = True, cache:int = None, lazy:bool = False):
         ...
 
     def combine(self, *fields:ModelField):
@@ -295,7 +423,8 @@ class GenericValidatorProvider(RWConfiguration, Generic[TOriginalModel]):
 
 class OutpostMeta(type):
 
-    __validators__ = list()
+    # registry of defined validators by name
+    __validators__: Dict[str, 'ABCOutpost'] = dict()
 
     @staticmethod
     def inherit_configurations(superclasses:Iterable['ABCOutpost'], current: GenericValidatorProvider = None) -> RWConfiguration:
@@ -332,8 +461,6 @@ class OutpostMeta(type):
 
         if name_ in class_.__validators__:
             raise AbstractError(f'Name collision: validator named "{name_}" alredy defined.') 
-        else:
-            class_.__validators__.append(name_)
             
         result_class = super().__new__(class_, name_, superclasses_, dict_)
         
@@ -344,6 +471,7 @@ class OutpostMeta(type):
                 break
 
         result_class.__config__ = class_.inherit_configurations(superclasses_, current_config).to_RO()
+        class_.__validators__[name_] = result_class
 
         # if result_class.__config__ is None:
         #     if current_config is None:
@@ -384,6 +512,10 @@ class ABCOutpost(metaclass=OutpostMeta):
     def raise_unnecessary(class_) -> bool:
         return class_.__config__.raise_unnecessary    
 
+    @classproperty
+    def codegen(class_) -> bool:
+        return class_.__config__.codegen
+
     @classproperty
     def readonly(class_) -> Tuple[ModelField]:
         return class_.__config__.readonly
@@ -410,24 +542,12 @@ class _PromisedValidator(ABCOutpost):
         self.name = validator_name
         self.__validator = None
 
-    @staticmethod
-    def __find_validator__(obj:Type[ABCOutpost], name:str):
-        for subclass in obj.__subclasses__():
-            if subclass.__name__ == name:
-                return subclass
-        else:
-            raise NoPromisedValidator(f'Promised validator "{name}" is not found')
-
     @property
     def assigned_validator(self):
         if self.__validator is None:
-            for subclass in ABCOutpost.__subclasses__():
-                try:
-                    self.__validator = self.__find_validator__(subclass, self.name)
-                    break
-                except NoPromisedValidator:
-                    continue
-            else:
+            try:
+                self.__validator = OutpostMeta.__validators__[self.name]
+            except KeyError:
                 raise NoPromisedValidator(f'Promised validator "{self.name}" was never defined')
 
         return self.__validator
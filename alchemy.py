@@ -1,13 +1,17 @@
+from dataclasses import dataclass, field
 from datetime import date, datetime, time
 from sqlalchemy.inspection import inspect
-from sqlalchemy import Column
+from sqlalchemy import Column, insert
+from sqlalchemy.engine import Engine
 from sqlalchemy.sql.sqltypes import String, Integer, Boolean, Float, Enum, DateTime, Date, Time
 from sqlalchemy.orm import RelationshipProperty
-from typing import Iterable, Any, Optional, Union, _GenericAlias
+from typing import Callable, Dict, Iterable, Any, List, Optional, Tuple, Union, _GenericAlias
 from collections import OrderedDict
 
 from .utils import ModelField
 from .abc import IAnnotationGenerator, IFieldGenerator, TOriginalModel
+from .batch import RowError
+from .exceptions import AbstractError, UnexpectedError, ValidationError
 
 
 class AlchemyFieldGenerator(IFieldGenerator):
@@ -96,4 +100,86 @@ class AlchemyAnnotationGenerator(IAnnotationGenerator):
                 return type_
         else:
             return Any
-        return str
\ No newline at end of file
+        return str
+
+
+@dataclass
+class IngestResult:
+    inserted: int = 0
+    # rejected rows are collected here if error sink is not given
+    errors: List[RowError] = field(default_factory=list)
+
+    @property
+    def ok(self) -> bool:
+        return len(self.errors) == 0
+
+
+def _insert_columns(model: TOriginalModel) -> Tuple[Any, Tuple[str], Tuple[str]]:
+    mapper = inspect(model)
+    if len(mapper.tables) > 1:
+        raise AbstractError(f'Model {model.__name__} is mapped to several tables and can not be ingested with single insert')
+    columns = AlchemyFieldGenerator(model).all_fields()
+    relationships = tuple(x._dependency_processor.key for x in mapper.relationships)
+    return mapper.local_table, tuple(x for x in columns if x not in relationships), relationships
+
+
+class _Flusher:
+    def __init__(self, bind: Any, table: Any) -> None:
+        self.bind = bind
+        self.statement = insert(table)
+
+    def __call__(self, rows: List[Dict[str, Any]]) -> int:
+        # executemany requires the same keys in all rows, so rows are grouped by passed columns
+        groups = dict()
+        for row in rows:
+            groups.setdefault(tuple(row.keys()), list()).append(row)
+
+        if isinstance(self.bind, Engine):
+            with self.bind.begin() as connection:
+                for group in groups.values():
+                    connection.execute(self.statement, group)
+        else:
+            # connections and sessions are flushed within transaction of caller
+            for group in groups.values():
+                self.bind.execute(self.statement, group)
+        return len(rows)
+
+
+def ingest(validator: type, datasets: Iterable[dict], bind: Any, *, batch_size: int = 1000,
+           on_error: Callable[[RowError], Any] = None) -> IngestResult:
+    if batch_size < 1:
+        raise AbstractError('batch_size must be positive')
+    table, columns, relationships = _insert_columns(validator.model)
+    # fields absent in dataset are not inserted, so column and server defaults are applied
+    bits = dict((x.name, x.bit) for x in validator.plan.field_plans)
+    # relationships can not be inserted, rows that contain them are rejected, so import is not left half-applied
+    relationship_plans = tuple(x for x in validator.plan.field_plans if x.name in relationships)
+    handler = validator._context_handler()
+    flush = _Flusher(bind, table)
+
+    result = IngestResult()
+    reject = on_error if on_error is not None else result.errors.append
+    rows = list()
+    for index, dataset in enumerate(datasets):
+        try:
+            ctx = handler(dataset)
+        except (ValidationError, UnexpectedError) as e:
+            reject(RowError(index, e))
+            continue
+
+        mask = ctx.slots[1]
+        rejected = next((x for x in relationship_plans if mask & x.bit), None)
+        if rejected is not None:
+            error = ValidationError('Relationship can not be ingested with insert', code='relationship')
+            reject(RowError(index, error.within((validator.__name__, rejected.field))))
+            continue
+        exported = ctx.export_dataset()
+        rows.append(dict((name, exported[name]) for name in columns if mask & bits.get(name, 0)))
+
+        if len(rows) >= batch_size:
+            result.inserted += flush(rows)
+            rows = list()
+
+    if rows:
+        result.inserted += flush(rows)
+    return result
@@ -0,0 +1,113 @@
+import importlib
+from collections import deque
+from concurrent.futures import Executor
+from dataclasses import dataclass, field
+from typing import Any, Callable, Iterable, Iterator, List, Tuple, Union
+
+from .exceptions import AbstractError, UnexpectedError, ValidationError
+
+
+@dataclass
+class RowError:
+    index: int
+    error: Exception
+
+    @property
+    def message(self) -> str:
+        return str(self.error)
+
+    def __str__(self):
+        return f'[{self.index}]: {self.error}'
+
+
+@dataclass
+class BatchResult:
+    # results of valid rows in order of input rows, failed rows are listed in errors
+    results: List[Any] = field(default_factory=list)
+    errors: List[RowError] = field(default_factory=list)
+
+    @property
+    def total(self) -> int:
+        return len(self.results) + len(self.errors)
+
+    @property
+    def ok(self) -> bool:
+        return len(self.errors) == 0
+
+    def __iter__(self):
+        return iter(self.results)
+
+    def __len__(self):
+        return len(self.results)
+
+
+def run_batch(datasets: Iterable[dict], handler: Callable[[dict], Any], start: int = 0) -> BatchResult:
+    result = BatchResult()
+    append = result.results.append
+    for index, dataset in enumerate(datasets, start):
+        try:
+            append(handler(dataset))
+        except (ValidationError, UnexpectedError) as e:
+            result.errors.append(RowError(index, e))
+    return result
+
+
+def iter_batch(datasets: Iterable[Any], handler: Callable[[Any], Any], start: int = 0) -> Iterator[Union[Any, RowError]]:
+    for index, dataset in enumerate(datasets, start):
+        try:
+            yield handler(dataset)
+        except (ValidationError, UnexpectedError) as e:
+            yield RowError(index, e)
+
+
+def validator_reference(validator: type) -> Tuple[str, str]:
+    # validators are passed to worker processes by importable name, because classes with decorated validators don't pickle
+    if '<locals>' in validator.__qualname__:
+        raise AbstractError(f'Validator "{validator.__qualname__}" must be defined on module level to be used in worker processes')
+    return validator.__module__, validator.__qualname__
+
+
+def resolve_validator(module: str, qualname: str) -> type:
+    result = importlib.import_module(module)
+    for name in qualname.split('.'):
+        result = getattr(result, name)
+    return result
+
+
+def _process_chunk(module: str, qualname: str, export: bool, datasets: List[Any], start: int) -> BatchResult:
+    validator = resolve_validator(module, qualname)
+    return run_batch(datasets, validator._batch_handler(export=export, strict=True), start)
+
+
+def _chunks(datasets: Iterable[Any], size: int) -> Iterator[List[Any]]:
+    chunk = list()
+    for dataset in datasets:
+        chunk.append(dataset)
+        if len(chunk) >= size:
+            yield chunk
+            chunk = list()
+    if chunk:
+        yield chunk
+
+
+def run_parallel(validator: type, datasets: Iterable[Any], export: bool, executor: Executor, chunk_size: int, window: int) -> BatchResult:
+    reference = validator_reference(validator)
+    result = BatchResult()
+    # only window of chunks is submitted at once, so input is consumed lazily and results are merged in order
+    pending = deque()
+
+    def merge(chunk_result: BatchResult):
+        result.results.extend(chunk_result.results)
+        result.errors.extend(chunk_result.errors)
+
+    start = 0
+    for chunk in _chunks(datasets, chunk_size):
+        pending.append(executor.submit(_process_chunk, *reference, export, chunk, start))
+        start += len(chunk)
+        if len(pending) >= window:
+            merge(pending.popleft().result())
+
+    while pending:
+        merge(pending.popleft().result())
+
+    return result
@@ -0,0 +1,397 @@
+import argparse
+import json
+import sys
+import tracemalloc
+from dataclasses import asdict, dataclass
+from time import perf_counter, perf_counter_ns
+from typing import Any, Callable, Dict, Iterable, List, Optional, Union
+
+from .exceptions import UnexpectedError, ValidationError
+from .rules import NOT
+from .types import Outpost, OutpostProvider
+
+
+@dataclass
+class BenchPhone:
+    number: int
+
+
+@dataclass
+class BenchUser:
+    id: int
+    name: Optional[str]
+    email: str
+    active: bool
+    phones: Iterable[BenchPhone]
+
+
+class BenchPhoneValidator(Outpost):
+    config = OutpostProvider.from_model(BenchPhone)
+    config.require(config.fields.number)
+
+
+class BenchUserValidator(Outpost):
+    config = OutpostProvider.from_model(BenchUser)
+    config.validator(config.fields.phones, BenchPhoneValidator)
+    config.missing_value = None
+    config.require(config.fields.id & config.fields.email)
+
+
+@dataclass
+class BenchFlat:
+    id: int
+    name: str
+    email: str
+    score: float
+    active: bool
+
+
+class BenchFlatValidator(Outpost):
+    config = OutpostProvider.from_model(BenchFlat)
+    config.require(config.fields.id & config.fields.email)
+
+
+class BenchFlatCodegenValidator(Outpost):
+    config = OutpostProvider.from_model(BenchFlat)
+    config.require(config.fields.id & config.fields.email)
+    config.codegen = True
+
+
+@dataclass
+class BenchMod:
+    name: str
+    price: int
+
+
+@dataclass
+class BenchItem:
+    sku: str
+    quantity: int
+    mods: List[BenchMod]
+
+
+@dataclass
+class BenchOrder:
+    id: int
+    note: Optional[str]
+    items: List[BenchItem]
+
+
+class BenchModValidator(Outpost):
+    config = OutpostProvider.from_model(BenchMod)
+
+
+class BenchItemValidator(Outpost):
+    config = OutpostProvider.from_model(BenchItem)
+    config.validator(config.fields.mods, BenchModValidator)
+
+
+class BenchOrderValidator(Outpost):
+    config = OutpostProvider.from_model(BenchOrder)
+    config.validator(config.fields.items, BenchItemValidator)
+
+
+@dataclass
+class BenchOptional:
+    a: Optional[int]
+    b: Union[int, str]
+    c: Optional[float]
+    d: Optional[bool]
+    e: Union[int, float, None]
+    f: Optional[str]
+    g: Union[bool, int, str]
+
+
+class BenchOptionalValidator(Outpost):
+    config = OutpostProvider.from_model(BenchOptional)
+
+
+@dataclass
+class BenchContact:
+    id: int
+    name: Optional[str]
+    email: Optional[str]
+    phone: Optional[str]
+    telegram: Optional[str]
+    note: Optional[str]
+
+
+class BenchContactValidator(Outpost):
+    config = OutpostProvider.from_model(BenchContact)
+    config.missing_value = None
+    config.require(
+        config.fields.id &
+        (config.fields.email | config.fields.phone | config.fields.telegram) &
+        (config.fields.name | NOT(config.fields.note))
+    )
+
+
+@dataclass
+class BenchSignup:
+    login: str
+    password: str
+    confirmation: str
+    age: int
+
+
+class BenchSignupValidator(Outpost):
+    config = OutpostProvider.from_model(BenchSignup)
+
+    @config.validator(config.fields.login)
+    def login(value):
+        value = str(value).strip().lower()
+        if len(value) < 3:
+            raise ValidationError('login is too short')
+        return value
+
+    @config.validator(config.fields.age)
+    def age(value):
+        value = int(value)
+        if not 0 < value < 150:
+            raise ValidationError('invalid age')
+        return value
+
+    @config.combine(config.fields.password, config.fields.confirmation)
+    def passwords(password, confirmation):
+        if password != confirmation:
+            raise ValidationError('passwords are different')
+
+
+def make_rows(count: int, invalid_every: int = 10) -> List[dict]:
+    rows = list()
+    for i in range(count):
+        row = {
+            'id': str(i),
+            'name': f'user {i}',
+            'email': f'user{i}@example.com',
+            'active': 'true',
+            'phones': [{'number': 89000000000 + i}, {'number': str(89100000000 + i)}],
+        }
+        if invalid_every and i % invalid_every == 0:
+            row['id'] = 'not a number'
+        rows.append(row)
+    return rows
+
+
+def rows_per_second(run: Callable[[List[dict]], None], rows: List[dict], repeat: int = 3) -> float:
+    best = None
+    for _ in range(repeat):
+        start = perf_counter()
+        run(rows)
+        elapsed = perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return len(rows) / best
+
+
+def per_row_loop(rows: List[dict]):
+    results, errors = list(), list()
+    for i, row in enumerate(rows):
+        try:
+            results.append(BenchUserValidator.map(row))
+        except (ValidationError, UnexpectedError) as e:
+            errors.append((i, str(e)))
+
+
+def batch(rows: List[dict]):
+    BenchUserValidator.map_many(rows)
+
+
+def batch_benchmark(count: int = 10000, workers: Optional[int] = None):
+    rows = make_rows(count)
+    loop_rate = rows_per_second(per_row_loop, rows)
+    batch_rate = rows_per_second(batch, rows)
+    print(f'rows: {count}')
+    print(f'per-row loop: {loop_rate:12.0f} rows/sec')
+    print(f'map_many:     {batch_rate:12.0f} rows/sec ({batch_rate / loop_rate:.2f}x)')
+    if workers:
+        parallel_rate = rows_per_second(lambda x: BenchUserValidator.map_many(x, workers=workers), rows, repeat=1)
+        print(f'map_many({workers} workers): {parallel_rate:12.0f} rows/sec ({parallel_rate / loop_rate:.2f}x)')
+
+
+@dataclass
+class BenchCase:
+    name: str
+    run: Callable[[], Any]
+
+
+@dataclass
+class BenchStats:
+    name: str
+    ops: float
+    # latency of one validation in microseconds
+    p50: float
+    p99: float
+    # peak of memory allocated during one validation in bytes
+    memory: int
+
+
+def _alchemy_cases() -> List[BenchCase]:
+    try:
+        from sqlalchemy import Boolean, Column, Integer, String, create_engine
+        from sqlalchemy.orm import declarative_base
+    except ImportError:
+        return list()
+
+    global _ALCHEMY
+    if _ALCHEMY is None:
+        Base = declarative_base()
+
+        class BenchAccount(Base):
+            __tablename__ = 'bench_accounts'
+            id = Column(Integer, primary_key=True)
+            name = Column(String, nullable=False)
+            email = Column(String, nullable=False)
+            active = Column(Boolean, nullable=True)
+
+        class BenchAccountValidator(Outpost):
+            config = OutpostProvider.from_model(BenchAccount)
+            config.require(config.fields.name & config.fields.email)
+
+        engine = create_engine('sqlite://')
+        Base.metadata.create_all(engine)
+        _ALCHEMY = BenchAccountValidator, engine
+
+    validator, engine = _ALCHEMY
+    row = {'name': 'user', 'email': 'user@example.com', 'active': 'true'}
+    rows = [{**row, 'name': f'user {i}'} for i in range(100)]
+
+    def ingest():
+        # rows are rolled back, so table doesn't grow between runs
+        with engine.connect() as connection:
+            validator.ingest(rows, connection)
+            connection.rollback()
+
+    return [
+        BenchCase('alchemy_map', lambda: validator.map(row)),
+        BenchCase('alchemy_ingest_100', ingest),
+    ]
+
+
+_ALCHEMY = None
+
+
+def bench_cases() -> List[BenchCase]:
+    flat = {'id': '1', 'name': 'user', 'email': 'user@example.com', 'score': '4.5', 'active': 'true'}
+    users = make_rows(100)
+    user = users[1]
+    order = {
+        'id': '1', 'note': None,
+        'items': [{'sku': f'sku {i}', 'quantity': '2', 'mods': [{'name': 'mod', 'price': j} for j in range(3)]} for i in range(20)],
+    }
+    optional = {'a': None, 'b': 'text', 'c': '1.5', 'd': None, 'e': 2, 'f': None, 'g': 'true'}
+    contact = {'id': 1, 'phone': '89000000000'}
+    signup = {'login': ' User ', 'password': 'secret', 'confirmation': 'secret', 'age': '30'}
+    mapped_order = BenchOrderValidator.map(order)
+
+    return [
+        BenchCase('dataclass', lambda: BenchFlat(id=1, name='user', email='user@example.com', score=4.5, active=True)),
+        BenchCase('flat', lambda: BenchFlatValidator.map(flat)),
+        BenchCase('flat_codegen', lambda: BenchFlatCodegenValidator.map(flat)),
+        BenchCase('nested', lambda: BenchUserValidator.map(user)),
+        BenchCase('nested_list', lambda: BenchOrderValidator.map(order)),
+        BenchCase('optional_union', lambda: BenchOptionalValidator.map(optional)),
+        BenchCase('requirements', lambda: BenchContactValidator.map(contact)),
+        BenchCase('custom', lambda: BenchSignupValidator.map(signup)),
+        BenchCase('map_many_100', lambda: BenchUserValidator.map_many(users)),
+        BenchCase('dump_json', lambda: BenchOrderValidator.dump_json(mapped_order)),
+        *_alchemy_cases(),
+    ]
+
+
+def measure(case: BenchCase, duration: float = 0.5, warmup: int = 20) -> BenchStats:
+    run = case.run
+    for _ in range(warmup):
+        run()
+
+    latencies = list()
+    append = latencies.append
+    deadline = perf_counter_ns() + int(duration * 1e9)
+    while True:
+        start = perf_counter_ns()
+        run()
+        end = perf_counter_ns()
+        append(end - start)
+        if end >= deadline:
+            break
+
+    tracemalloc.start()
+    try:
+        tracemalloc.reset_peak()
+        current, _ = tracemalloc.get_traced_memory()
+        run()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    latencies.sort()
+    return BenchStats(
+        name=case.name,
+        ops=len(latencies) / (sum(latencies) / 1e9),
+        p50=latencies[len(latencies) // 2] / 1e3,
+        p99=latencies[min(len(latencies) - 1, len(latencies) * 99 // 100)] / 1e3,
+        memory=peak - current,
+    )
+
+
+def regressions(stats: List[BenchStats], baseline: Dict[str, dict], threshold: float) -> List[str]:
+    # cases missing in baseline are not compared
+    result = list()
+    for item in stats:
+        base = baseline.get(item.name)
+        if base is None:
+            continue
+        if item.ops < base['ops'] * (1 - threshold):
+            result.append(f'{item.name}: {item.ops:.0f} ops/sec, baseline {base["ops"]:.0f}')
+        if item.memory > base['memory'] * (1 + threshold):
+            result.append(f'{item.name}: {item.memory} bytes, baseline {base["memory"]}')
+    return result
+
+
+def main(argv: List[str] = None) -> int:
+    parser = argparse.ArgumentParser(prog='python -m outpost bench', description='Benchmarks of outpost validation modes')
+    parser.add_argument('cases', nargs='*', help='names of cases to run, all by default')
+    parser.add_argument('--duration', type=float, default=0.5, help='seconds per case')
+    parser.add_argument('--save', metavar='FILE', help='save results as baseline json')
+    parser.add_argument('--baseline', metavar='FILE', help='compare results with baseline json')
+    parser.add_argument('--threshold', type=float, default=0.1, help='allowed regression, 0.1 is 10%%')
+    args = parser.parse_args(argv)
+
+    cases = bench_cases()
+    if args.cases:
+        unknown = set(args.cases) - set(case.name for case in cases)
+        if unknown:
+            parser.error(f'unknown cases: {", ".join(sorted(unknown))}')
+        cases = [case for case in cases if case.name in args.cases]
+
+    stats = list()
+    reference = None
+    print(f'{"case":20} {"ops/sec":>12} {"p50 us":>10} {"p99 us":>10} {"bytes":>10} {"x dataclass":>12}')
+    for case in cases:
+        item = measure(case, duration=args.duration)
+        stats.append(item)
+        if case.name == 'dataclass':
+            reference = item.ops
+        ratio = f'{reference / item.ops:12.1f}' if reference else f'{"":12}'
+        print(f'{item.name:20} {item.ops:12.0f} {item.p50:10.1f} {item.p99:10.1f} {item.memory:10} {ratio}')
+
+    if args.save:
+        with open(args.save, 'w') as file:
+            json.dump(dict((item.name, asdict(item)) for item in stats), file, indent=2)
+
+    if args.baseline:
+        with open(args.baseline) as file:
+            failed = regressions(stats, json.load(file), args.threshold)
+        if failed:
+            print(f'regressions over {args.threshold:.0%}:')
+            for line in failed:
+                print(f'  {line}')
+            return 1
+
+    return 0
+
+
+if __name__ == '__main__':
+    batch_benchmark(
+        int(sys.argv[1]) if len(sys.argv) > 1 else 10000,
+        int(sys.argv[2]) if len(sys.argv) > 2 else None,
+    )
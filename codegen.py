@@ -0,0 +1,274 @@
+import keyword
+import linecache
+from collections.abc import Iterable
+from operator import methodcaller
+from typing import Any, Callable, Dict, List
+
+from .abc import _EXCLUDE_MISSING
+from .exceptions import NativeValidationError, UnexpectedError, ValidationError
+from .lazy import LazySequence
+from .plan import ValidationPlan
+from .rules import AND, NOT, OR, NoRequirements, Require, Rule
+
+
+class _SourceBuilder:
+    def __init__(self) -> None:
+        self.lines: List[str] = list()
+        self.indent = 0
+
+    def line(self, text: str = ''):
+        self.lines.append(('    ' * self.indent + text) if text else '')
+
+    def block(self):
+        builder = self
+
+        class _Block:
+            def __enter__(self):
+                builder.indent += 1
+
+            def __exit__(self, *_):
+                builder.indent -= 1
+
+        return _Block()
+
+    def source(self) -> str:
+        return '\n'.join(self.lines) + '\n'
+
+
+class CodegenEngine:
+
+    def __init__(self, plan: ValidationPlan, validator_name: str, context_class: type) -> None:
+        self.plan = plan
+        self.validator_name = validator_name
+        self.namespace: Dict[str, Any] = dict()
+        self.source = self.generate(context_class)
+
+        filename = f'<outpost generated {validator_name}>'
+        # register source to make generated frames readable in tracebacks and debuggers
+        linecache.cache[filename] = (len(self.source), None, self.source.splitlines(True), filename)
+        exec(compile(self.source, filename, 'exec'), self.namespace)
+
+        self.validate: Callable[[dict], dict] = self.namespace['validate']
+        self.map: Callable[[dict], Any] = self.namespace['map']
+
+    def __str__(self):
+        return self.source
+
+    def _requirements_expression(self, rule: Rule, index: Dict[Any, int]) -> str:
+        if isinstance(rule, NoRequirements):
+            return 'True'
+        elif isinstance(rule, Require):
+            if rule.field in index:
+                return f'has_{index[rule.field]}'
+            return 'False'
+        elif isinstance(rule, AND):
+            return '(' + ' and '.join(self._requirements_expression(x, index) for x in rule.rules) + ')'
+        elif isinstance(rule, OR):
+            return '(' + ' or '.join(self._requirements_expression(x, index) for x in rule.rules) + ')'
+        elif isinstance(rule, NOT):
+            return f'(not {self._requirements_expression(rule.rule, index)})'
+        else:
+            # user-defined rule is checked against list of passed fields
+            name = f'U_{sum(1 for x in self.namespace if x.startswith("U_"))}'
+            self.namespace[name] = rule.check
+            return f'{name}(passed_fields())'
+
+    @staticmethod
+    def _has_custom_rules(rule: Rule) -> bool:
+        if isinstance(rule, (NoRequirements, Require)):
+            return False
+        elif isinstance(rule, (AND, OR)):
+            return any(CodegenEngine._has_custom_rules(x) for x in rule.rules)
+        elif isinstance(rule, NOT):
+            return CodegenEngine._has_custom_rules(rule.rule)
+        return True
+
+    def generate(self, context_class: type) -> str:
+        plan = self.plan
+        ns = self.namespace
+        ns.update(
+            ValidationError=ValidationError,
+            NativeValidationError=NativeValidationError,
+            UnexpectedError=UnexpectedError,
+            Iterable=Iterable,
+            LazySequence=LazySequence,
+            methodcaller=methodcaller,
+            N=self.validator_name,
+            MODEL=plan.model,
+            MISSING_VALUE=plan.missing_value,
+            ValidationContext=context_class,
+        )
+
+        index = dict()
+        for i, field_plan in enumerate(plan.field_plans):
+            index[field_plan.field] = i
+            ns[f'F_{i}'] = field_plan.field
+            ns[f'R_{i}'] = field_plan.coercer
+            if field_plan.has_default:
+                ns[f'D_{i}'] = field_plan.default
+        for i, combinator in enumerate(plan.combinators):
+            ns[f'C_{i}'] = combinator.method
+
+        b = _SourceBuilder()
+        b.line(f'# generated by outpost for {self.validator_name}')
+        b.line()
+        b.line('def export(value, method):')
+        with b.block():
+            b.line('if isinstance(value, ValidationContext):')
+            with b.block():
+                b.line('return getattr(value, method)()')
+            b.line('elif isinstance(value, LazySequence):')
+            with b.block():
+                b.line('return value.exported(methodcaller(method))')
+            b.line('elif isinstance(value, Iterable) and not (isinstance(value, dict) or isinstance(value, str)):')
+            with b.block():
+                b.line('result = [getattr(x, method)() if isinstance(x, ValidationContext) else x for x in value]')
+                b.line('return tuple(result) if isinstance(value, tuple) else result')
+            b.line('return value')
+        b.line()
+
+        b.line('def validate(dataset):')
+        with b.block():
+            self._generate_pipeline(b, index)
+            # dataset is returned as slots of validation context
+            values = ', '.join('None' if x.readonly else f'value_{i}' for i, x in enumerate(plan.field_plans))
+            mask = ' | '.join(f'has_{i} << {i}' for i, x in enumerate(plan.field_plans) if not x.readonly) or '0'
+            b.line(f'return [{values}], {mask}')
+        b.line()
+
+        b.line('def map(dataset):')
+        with b.block():
+            self._generate_pipeline(b, index)
+            if plan.constructor is not None and plan.constructor.kind != 'dataclass':
+                # __init__ of frozen and slots dataclasses and sqlalchemy models is slower than direct construction,
+                # kwargs are used only if model must be constructed by its __init__
+                ns['CONSTRUCT'] = plan.constructor
+                values = ', '.join('None' if x.readonly else f'value_{i}' for i, x in enumerate(plan.field_plans))
+                mask = ' | '.join(f'has_{i} << {i}' for i, x in enumerate(plan.field_plans) if not x.readonly) or '0'
+                b.line(f'result = CONSTRUCT([{values}], {mask})')
+                b.line('if result is not None:')
+                with b.block():
+                    b.line('return result')
+            if plan.missing_value is _EXCLUDE_MISSING:
+                b.line('kwargs = {}')
+                for i, field_plan in enumerate(plan.field_plans):
+                    if field_plan.readonly:
+                        continue
+                    b.line(f'if has_{i}:')
+                    with b.block():
+                        b.line(f'kwargs[{field_plan.name!r}] = {self._export_expression(i, field_plan)}')
+                b.line('return MODEL(**kwargs)')
+            elif all(x.name.isidentifier() and not keyword.iskeyword(x.name) for x in plan.field_plans):
+                b.line('return MODEL(')
+                with b.block():
+                    for i, field_plan in enumerate(plan.field_plans):
+                        b.line(f'{field_plan.name}={self._map_expression(i, field_plan)},')
+                b.line(')')
+            else:
+                b.line('return MODEL(**{')
+                with b.block():
+                    for i, field_plan in enumerate(plan.field_plans):
+                        b.line(f'{field_plan.name!r}: {self._map_expression(i, field_plan)},')
+                b.line('})')
+
+        return b.source()
+
+    def _generate_pipeline(self, b: _SourceBuilder, index: Dict[Any, int]):
+        plan = self.plan
+        b.line('if not isinstance(dataset, dict):')
+        with b.block():
+            b.line("raise NativeValidationError('Invalid typecast. Object required.', code='typecast')")
+        # leftover keys are only needed to report unnecessary fields
+        take = 'pop' if plan.raise_unnecessary else 'get'
+        if plan.raise_unnecessary:
+            b.line('dataset = {**dataset}')
+        # ModelField keys are looked up only if there are any, because their hashing is slow
+        b.line('enumerized = not all(isinstance(key, str) for key in dataset)')
+        b.line()
+
+        # enumerize_dataset + filter_readonly
+        for i, field_plan in enumerate(plan.field_plans):
+            b.line(f'# {field_plan.field}')
+            b.line(f'if {field_plan.name!r} in dataset:')
+            with b.block():
+                b.line(f'value_{i} = dataset.{take}({field_plan.name!r})')
+                b.line(f'has_{i} = True')
+            b.line(f'elif enumerized and F_{i} in dataset:')
+            with b.block():
+                b.line(f'value_{i} = dataset.{take}(F_{i})')
+                b.line(f'has_{i} = True')
+            b.line('else:')
+            with b.block():
+                if field_plan.has_default:
+                    b.line(f'value_{i} = D_{i}')
+                    b.line(f'has_{i} = True')
+                else:
+                    b.line(f'value_{i} = None')
+                    b.line(f'has_{i} = False')
+            if field_plan.readonly:
+                b.line(f'has_{i} = False')
+        b.line()
+
+        if plan.raise_unnecessary:
+            b.line('if len(dataset) > 0:')
+            with b.block():
+                b.line("raise ValidationError(f'Given dataset contains unnecessary fields: {[str(x) for x in dataset.keys()]}', code='unnecessary')")
+            b.line()
+
+        # check_requirements
+        if self._has_custom_rules(plan.requirements):
+            b.line('def passed_fields():')
+            with b.block():
+                pairs = ''.join(f'(F_{i}, has_{i}), ' for i in range(len(plan.field_plans)))
+                b.line(f'return [field for field, has in ({pairs}) if has]')
+        b.line(f'if not {self._requirements_expression(plan.requirements, index)}:')
+        with b.block():
+            b.line(f'raise ValidationError({"Given dataset does not satisfying the requirements: " + plan.requirements_text!r}, code=\'requirements\')')
+        b.line()
+
+        # validate
+        for i, field_plan in enumerate(plan.field_plans):
+            if field_plan.readonly:
+                continue
+            prefix = f'{self.validator_name}({field_plan.field})'
+            b.line(f'if has_{i}:')
+            with b.block():
+                b.line('try:')
+                with b.block():
+                    if field_plan.default_ready:
+                        b.line(f'value_{i} = value_{i} if value_{i} is D_{i} else R_{i}(value_{i})')
+                    else:
+                        b.line(f'value_{i} = R_{i}(value_{i})')
+                b.line('except ValidationError as e:')
+                with b.block():
+                    b.line(f'raise e.within((N, F_{i}))')
+                b.line('except UnexpectedError as e:')
+                with b.block():
+                    b.line(f'raise UnexpectedError({prefix + " -> "!r} + str(e))')
+                b.line('except Exception as e:')
+                with b.block():
+                    b.line(f"raise UnexpectedError({prefix + ': Unexpected error with value '!r} + f'{{value_{i}}}: {{str(e)}}') from e")
+        b.line()
+
+        # combine
+        for i, combinator in enumerate(plan.combinators):
+            positions = [index.get(field) for field in combinator.fields]
+            if any(x is None or plan.field_plans[x].readonly for x in positions):
+                continue
+            condition = ' and '.join(f'has_{x}' for x in positions) or 'True'
+            b.line(f'if {condition}:')
+            with b.block():
+                b.line(f'C_{i}(' + ', '.join(f'value_{x}' for x in positions) + ')')
+        b.line()
+
+    @staticmethod
+    def _export_expression(i: int, field_plan) -> str:
+        if field_plan.validator is None:
+            return f'value_{i}'
+        return f"export(value_{i}, 'map')"
+
+    @classmethod
+    def _map_expression(class_, i: int, field_plan) -> str:
+        if field_plan.readonly:
+            return 'MISSING_VALUE'
+        return f'{class_._export_expression(i, field_plan)} if has_{i} else MISSING_VALUE'
@@ -0,0 +1,465 @@
+import asyncio
+import types
+from abc import ABC, abstractmethod
+from collections.abc import Iterable as IterableABC
+from typing import Any, Callable, Dict, Tuple, Union, get_args, get_origin
+
+from .abc import Validator
+from .exceptions import AbstractError, NativeValidationError, NotNoneError, ValidationError
+from .lazy import LazySequence
+from .type_validators import TYPE_VALIDATOR
+
+
+NoneType = type(None)
+
+_UNION_ORIGINS = (Union, types.UnionType)
+# limit of distinct value types memoized by union coercer
+_DISPATCH_SIZE = 64
+_ARRAY_ORIGINS = (list, tuple, IterableABC)
+
+
+def getname(obj):
+    try:
+        return obj._name
+    except AttributeError:
+        try:
+            return obj.__name__
+        except AttributeError:
+            return str(obj)
+
+
+def is_union(annotation: type) -> bool:
+    return get_origin(annotation) in _UNION_ORIGINS
+
+
+def is_array(annotation: type) -> bool:
+    return annotation is tuple or annotation is list or get_origin(annotation) in _ARRAY_ORIGINS
+
+
+def _rejects_array(type_: type) -> bool:
+    return (not issubclass(type_, IterableABC)) or issubclass(type_, (dict, str))
+
+
+def _check_array(value):
+    if (not isinstance(value, IterableABC)) or (isinstance(value, dict)) or (isinstance(value, str)):
+        raise NativeValidationError(f'Invalid typecast. Array required.', code='typecast')
+
+
+def _is_builtin(type_: Any) -> bool:
+    return getattr(type_, '__module__', None) == 'builtins'
+
+
+class Coercer(ABC):
+    # coercer is awaitable if it may call async or nested validators
+    awaitable = False
+    # pure coercer calls only builtin types, so it may be called before requirements are checked
+    pure = False
+
+    def rejects(self, type_: type) -> bool:
+        # coercer rejects values of this type with native error, without calling anything user-defined
+        return False
+
+    def item_handler(self) -> Callable[[Any], Any]:
+        # callable used for each item of homogeneous array
+        return self
+
+    def link(self) -> None:
+        # resolves everything that is resolved lazily on first call
+        for _, coercer in getattr(self, 'arms', ()):
+            if coercer is not None:
+                coercer.link()
+
+    def __init__(self, annotation: type) -> None:
+        self.annotation = annotation
+
+    @abstractmethod
+    def __call__(self, value: Any) -> Any:
+        pass
+
+    async def acall(self, value: Any) -> Any:
+        return self(value)
+
+    def __repr__(self):
+        return f'<{self.__class__.__name__} {getname(self.annotation)}>'
+
+
+class ClassCoercer(Coercer):
+    def __init__(self, annotation: type) -> None:
+        super().__init__(annotation)
+        self.pure = _is_builtin(annotation)
+
+    def rejects(self, type_):
+        return type_ is NoneType
+
+    def __call__(self, value):
+        if value is None:
+            raise NativeValidationError('value required', code='required')
+        try:
+            return self.annotation(value)
+        except (ValueError, TypeError) as e:
+            raise ValidationError(f'Invalid typecast: {str(e)}', code='typecast')
+
+
+class BoolCoercer(Coercer):
+    pure = True
+
+    def rejects(self, type_):
+        return type_ is NoneType
+
+    def __call__(self, value):
+        if value is None:
+            raise NativeValidationError('value required', code='required')
+        if isinstance(value, str):
+            if value.strip().lower() == 'true':
+                return True
+            elif value.strip().lower() == 'false':
+                return False
+            else:
+                raise ValidationError(f'Invalid typecast: invalid literal for Boolean: "{value}"', code='typecast')
+        try:
+            return bool(value)
+        except (ValueError, TypeError) as e:
+            raise ValidationError(f'Invalid typecast: {str(e)}', code='typecast')
+
+
+class ValidatorCoercer(Coercer):
+    def __init__(self, annotation: type, validator: Validator) -> None:
+        super().__init__(annotation)
+        self.validator = validator
+        # imported here because validation contexts are defined on top of compiled plans
+        from .types import ValidationContext
+        self.context_class = ValidationContext
+        self.awaitable = validator.validator is not None or validator.is_async
+        # resolved on first call, because promised validators may be defined later
+        self.handler = None
+
+    def __call__(self, value):
+        handler = self.handler
+        if handler is None:
+            handler = self.item_handler()
+        return handler(value)
+
+    def validate(self, value):
+        return self.check(self.validator.validate(value))
+
+    def item_handler(self):
+        if self.handler is None:
+            validator = self.validator
+            nested = validator.validator
+            if nested is None or (validator.check_result_type and self.annotation != nested.model):
+                self.handler = self.validate
+            else:
+                # nested validator prepares its plan once, nested values are validated without Outpost.validate
+                self.handler = nested._nested_handler()
+        return self.handler
+
+    def link(self):
+        self.item_handler()
+
+    async def acall(self, value):
+        return self.check(await self.validator.avalidate(value))
+
+    def check(self, result):
+        validator = self.validator
+        if validator.check_result_type:
+            if isinstance(result, self.context_class):
+                if self.annotation != validator.validator.model:
+                    raise AbstractError(f'Field annotation and validator model are different')
+            elif not TYPE_VALIDATOR._is_instance(result, self.annotation):
+                raise RuntimeError(f'Invalid typecast after user-defined validation: validator returned {type(result)}, but {str(self.annotation)} required.')
+
+        return result
+
+
+class UnionCoercer(Coercer):
+    def __init__(self, annotation: type, arms: Tuple[Tuple[type, Coercer]]) -> None:
+        super().__init__(annotation)
+        # coercer of NoneType arm is None
+        self.arms = arms
+        self.awaitable = any(coercer is not None and coercer.awaitable for _, coercer in arms)
+        self.pure = all(coercer is None or coercer.pure for _, coercer in arms)
+        self.dispatch: Dict[type, tuple] = dict()
+
+    def candidates(self, type_: type) -> Tuple[Tuple[int, type, Coercer]]:
+        # arms that can not reject value of given type, in order of annotation
+        try:
+            return self.dispatch[type_]
+        except KeyError:
+            result = tuple(
+                (position, arg, coercer) for position, (arg, coercer) in enumerate(self.arms)
+                if not (type_ is not NoneType if coercer is None else coercer.rejects(type_))
+            )
+            if len(self.dispatch) < _DISPATCH_SIZE:
+                self.dispatch[type_] = result
+            return result
+
+    def __call__(self, value):
+        outcomes = None
+        for position, arg, coercer in self.dispatch.get(type(value)) or self.candidates(type(value)):
+            if coercer is None:
+                return None
+            try:
+                return coercer(value)
+            except ValidationError as e:
+                if outcomes is None:
+                    outcomes = dict()
+                outcomes[position] = e
+        self.fail(value, outcomes or dict())
+
+    async def acall(self, value):
+        if not self.awaitable:
+            return self(value)
+
+        # arms are tried one by one, because first matching arm wins
+        outcomes = dict()
+        for position, arg, coercer in self.candidates(type(value)):
+            if coercer is None:
+                return None
+            try:
+                return await coercer.acall(value)
+            except ValidationError as e:
+                outcomes[position] = e
+        self.fail(value, outcomes)
+
+    def fail(self, value, outcomes: Dict[int, ValidationError]):
+        errors = list((self.arms[position][0], e) for position, e in sorted(outcomes.items()) if not isinstance(e, NativeValidationError))
+        if len(errors) > 0:
+            raise ValidationError.alternatives((getname(arg), err) for arg, err in errors)
+
+        # skipped arms fail with native errors only, last of them is raised as if all arms were tried
+        native_error = None
+        notnone_error = None
+        for position, (arg, coercer) in enumerate(self.arms):
+            e = outcomes.get(position)
+            if e is None:
+                try:
+                    if coercer is None:
+                        raise NotNoneError('Value is not None', code='not_none')
+                    coercer(value)
+                except NativeValidationError as error:
+                    e = error
+            if isinstance(e, NotNoneError):
+                notnone_error = e
+            else:
+                native_error = e
+        raise native_error or notnone_error
+
+
+class ArrayCoercer(Coercer):
+    # array without items annotation
+    def __init__(self, annotation: type, container: type) -> None:
+        super().__init__(annotation)
+        self.container = container
+        self.pure = _is_builtin(container)
+
+    def rejects(self, type_):
+        return _rejects_array(type_)
+
+    def __call__(self, value):
+        _check_array(value)
+        return self.container(value)
+
+
+class IterableCoercer(Coercer):
+    def __init__(self, annotation: type, container: type, arms: Tuple[Tuple[type, Coercer]]) -> None:
+        super().__init__(annotation)
+        self.container = container
+        self.arms = arms
+        self.awaitable = any(coercer.awaitable for _, coercer in arms)
+        self.pure = all(coercer.pure for _, coercer in arms)
+
+    def rejects(self, type_):
+        return _rejects_array(type_)
+
+    def __call__(self, value):
+        _check_array(value)
+
+        result = list()
+        for i, subvalue in enumerate(value):
+            errors = list()
+            native_error = None
+            notnone_error = None
+            for arg, coercer in self.arms:
+                try:
+                    result.append(coercer(subvalue))
+                    break
+                except NotNoneError as e:
+                    notnone_error = e
+                    continue
+                except NativeValidationError as e:
+                    native_error = e
+                    continue
+                except ValidationError as e:
+                    errors.append((arg, e))
+                    continue
+            else:
+                if len(errors) > 0:
+                    raise ValidationError.alternatives((('', err) for _, err in errors), i)
+                else:
+                    raise native_error or notnone_error
+
+        if self.container is tuple:
+            return tuple(result)
+        else:
+            return result
+
+    async def _aitem(self, i, subvalue):
+        errors = list()
+        native_error = None
+        notnone_error = None
+        for arg, coercer in self.arms:
+            try:
+                return await coercer.acall(subvalue)
+            except NotNoneError as e:
+                notnone_error = e
+                continue
+            except NativeValidationError as e:
+                native_error = e
+                continue
+            except ValidationError as e:
+                errors.append((arg, e))
+                continue
+        else:
+            if len(errors) > 0:
+                raise ValidationError.alternatives((('', err) for _, err in errors), i)
+            else:
+                raise native_error or notnone_error
+
+    async def acall(self, value):
+        if not self.awaitable:
+            return self(value)
+        _check_array(value)
+
+        # elements are validated concurrently, error of the first failed element is raised
+        result = await asyncio.gather(*(self._aitem(i, subvalue) for i, subvalue in enumerate(value)), return_exceptions=True)
+        for outcome in result:
+            if isinstance(outcome, BaseException):
+                raise outcome
+
+        if self.container is tuple:
+            return tuple(result)
+        else:
+            return result
+
+
+class ListCoercer(IterableCoercer):
+    # homogeneous array: Iterable[X], List[X], Tuple[X, ...]
+    def __init__(self, annotation: type, container: type, item: Tuple[type, Coercer]) -> None:
+        super().__init__(annotation, container, (item,))
+        self.item = item[1]
+
+    def __call__(self, value):
+        _check_array(value)
+
+        coercer = self.item.item_handler()
+        result = list()
+        append = result.append
+        i = 0
+        try:
+            for subvalue in value:
+                append(coercer(subvalue))
+                i += 1
+        except NativeValidationError:
+            raise
+        except ValidationError as e:
+            raise ValidationError.alternatives((('', e),), i)
+
+        if self.container is tuple:
+            return tuple(result)
+        else:
+            return result
+
+    async def _aitem(self, i, subvalue):
+        try:
+            return await self.item.acall(subvalue)
+        except NativeValidationError:
+            raise
+        except ValidationError as e:
+            raise ValidationError.alternatives((('', e),), i)
+
+
+class LazyListCoercer(ListCoercer):
+    # homogeneous array of nested models: config.validator(field, validator, lazy=True).
+    # only types of items are checked, items are validated on access to result sequence.
+    # async validation is eager
+    def __init__(self, annotation: type, container: type, item: Tuple[type, Coercer], owner: tuple = None) -> None:
+        super().__init__(annotation, container, item)
+        self.owner = owner
+
+    def __call__(self, value):
+        _check_array(value)
+
+        items = list(value)
+        coercer = self.item.item_handler()
+        for i, subvalue in enumerate(items):
+            if not isinstance(subvalue, dict):
+                # raises the same error as eager validation
+                try:
+                    coercer(subvalue)
+                except NativeValidationError:
+                    raise
+                except ValidationError as e:
+                    raise ValidationError.alternatives((('', e),), i)
+        return LazySequence(items, coercer, self.item.context_class, self.owner)
+
+
+def _build_coercer(annotation: type, validator: Validator, owner: tuple = None) -> Coercer:
+    origin = get_origin(annotation)
+
+    if origin in _UNION_ORIGINS:
+        return UnionCoercer(annotation, tuple(
+            (arg, None if (arg is NoneType or arg is None) else build_coercer(arg, validator, owner))
+            for arg in get_args(annotation)
+        ))
+
+    elif is_array(annotation):
+        container = tuple if (annotation is tuple or origin is tuple) else list
+        # Tuple[X, ...] is homogeneous tuple of X
+        args = tuple(arg for arg in get_args(annotation) if arg is not Ellipsis)
+        if origin is None:
+            return ArrayCoercer(annotation, annotation)
+        elif len(args) == 0:
+            return ArrayCoercer(annotation, container)
+        elif len(args) == 1:
+            item = build_coercer(args[0], validator)
+            if validator is not None and validator.lazy and isinstance(item, ValidatorCoercer):
+                return LazyListCoercer(annotation, container, (args[0], item), owner)
+            return ListCoercer(annotation, container, (args[0], item))
+        else:
+            return IterableCoercer(annotation, container, tuple((arg, build_coercer(arg, validator)) for arg in args))
+
+    elif validator:
+        return ValidatorCoercer(annotation, validator)
+
+    elif annotation is bool:
+        return BoolCoercer(annotation)
+
+    else:
+        return ClassCoercer(annotation)
+
+
+# coercers without validator are shared by annotation, coercers of validator are kept by validator itself
+_COERCERS: Dict[Any, Coercer] = dict()
+
+
+def _cache_key(annotation: Any) -> Any:
+    # equal annotations are not interchangeable: Union[int, str] == Union[str, int], but arms are tried in order,
+    # and Literal[1] == Literal[True]. so key keeps order of arguments and their types
+    args = get_args(annotation)
+    if not args:
+        return annotation.__class__, annotation
+    return get_origin(annotation), tuple(_cache_key(arg) for arg in args)
+
+
+def build_coercer(annotation: type, validator: Validator = None, owner: tuple = None) -> Coercer:
+    # owner (validator name, field) is required only by lazy arrays, their errors are raised outside of validation
+    cache = _COERCERS if validator is None else validator.coercers
+    key = _cache_key(annotation) if owner is None else (_cache_key(annotation), owner)
+    try:
+        return cache[key]
+    except KeyError:
+        coercer = cache[key] = _build_coercer(annotation, validator, owner)
+        return coercer
+    except TypeError:
+        # unhashable annotation
+        return _build_coercer(annotation, validator, owner)
@@ -0,0 +1,240 @@
+from dataclasses import dataclass, field
+from typing import Any, Dict, Iterator, List, Mapping, Tuple, get_args
+
+from .coercers import NoneType, is_union
+from .exceptions import AbstractError, NativeValidationError, UnexpectedError, ValidationError
+from .plan import FieldPlan, ValidationPlan
+from .rules import AND, NOT, OR, NoRequirements, Require, Rule
+
+
+_FLAT_TYPES = (int, float, bool, str)
+
+
+def _item(value: Any) -> Any:
+    # numpy scalars are converted to python objects
+    return value.item() if hasattr(value, 'item') else value
+
+
+def _numpy():
+    try:
+        import numpy
+    except ImportError:
+        raise ImportError('Columnar validation requires numpy. Make shure it is installed: pip install numpy')
+    return numpy
+
+
+@dataclass
+class ColumnarResult:
+    # validated columns are masked arrays: missing and invalid cells are masked
+    columns: Dict[str, Any]
+    valid: Any
+    reasons: Dict[int, List[str]] = field(default_factory=dict)
+
+    def __len__(self):
+        return len(self.valid)
+
+    def valid_rows(self) -> Iterator[dict]:
+        for i in self.valid.nonzero()[0]:
+            yield dict((name, _item(column.data[i])) for name, column in self.columns.items() if not column.mask[i])
+
+
+def _flat_type(field_plan: FieldPlan) -> type:
+    annotation = field_plan.annotation
+    if annotation in _FLAT_TYPES:
+        return annotation
+    if is_union(annotation):
+        args = tuple(arg for arg in get_args(annotation) if arg is not NoneType)
+        if len(args) == 1 and args[0] in _FLAT_TYPES:
+            return args[0]
+    raise AbstractError(f'Field {field_plan.field} of type {annotation} is not supported in columnar mode. Only flat int, float, bool, str and Optional fields are supported.')
+
+
+def _input_columns(np, plan: ValidationPlan, columns: Any) -> Tuple[Dict[FieldPlan, Any], int]:
+    if hasattr(columns, 'dtype') and columns.dtype.names is not None:
+        columns = dict((name, columns[name]) for name in columns.dtype.names)
+    if not isinstance(columns, Mapping):
+        raise NativeValidationError('Invalid typecast. Object of columns required.', code='typecast')
+
+    by_key = dict()
+    for field_plan in plan.field_plans:
+        by_key[field_plan.name] = field_plan
+        by_key[field_plan.field] = field_plan
+
+    result = dict()
+    unnecessary = list()
+    size = None
+    for key, column in columns.items():
+        if np.ma.isMaskedArray(column):
+            # filled(None) means default fill value, masked cells must be None to be missing
+            data = column.data.astype(object)
+            data[np.ma.getmaskarray(column)] = None
+            column = data
+        column = np.asarray(column)
+        if column.ndim != 1:
+            raise NativeValidationError(f'Invalid typecast. Column {key} must be one-dimensional array.', code='typecast')
+        if size is None:
+            size = len(column)
+        elif size != len(column):
+            raise NativeValidationError(f'Invalid typecast. All columns must have equal length.', code='typecast')
+
+        field_plan = by_key.get(key)
+        if field_plan is None:
+            unnecessary.append(key)
+        elif field_plan not in result or key == field_plan.name:
+            result[field_plan] = column
+
+    if plan.raise_unnecessary and len(unnecessary) > 0:
+        raise ValidationError(f'Given dataset contains unnecessary fields: {[str(x) for x in unnecessary]}', code='unnecessary')
+
+    return result, size or 0
+
+
+def _presence(np, column: Any) -> Any:
+    if column.dtype.kind == 'O':
+        # NaN is missing value for object columns too, it is the only value not equal to itself
+        return ~(np.equal(column, None) | np.not_equal(column, column).astype(bool))
+    elif column.dtype.kind == 'f':
+        return ~np.isnan(column)
+    else:
+        return np.ones(len(column), dtype=bool)
+
+
+def _requirements_mask(np, rule: Rule, presence: Dict[Any, Any], size: int) -> Any:
+    if isinstance(rule, NoRequirements):
+        return np.ones(size, dtype=bool)
+    elif isinstance(rule, Require):
+        return presence.get(rule.field, np.zeros(size, dtype=bool))
+    elif isinstance(rule, AND):
+        return np.logical_and.reduce([_requirements_mask(np, x, presence, size) for x in rule.rules])
+    elif isinstance(rule, OR):
+        return np.logical_or.reduce([_requirements_mask(np, x, presence, size) for x in rule.rules])
+    elif isinstance(rule, NOT):
+        return ~_requirements_mask(np, rule.rule, presence, size)
+    else:
+        # user-defined rules are resolved row by row
+        result = np.ones(size, dtype=bool)
+        for i in range(size):
+            passed = [field for field, mask in presence.items() if mask[i]]
+            result[i] = rule.check(passed)
+        return result
+
+
+def _cast_bool(np, values: Any) -> Any:
+    kind = values.dtype.kind
+    if kind == 'b':
+        return values
+    elif kind in 'iuf':
+        return values != 0
+    elif kind == 'U':
+        normalized = np.char.lower(np.char.strip(values))
+        true, false = normalized == 'true', normalized == 'false'
+        if not (true | false).all():
+            raise ValueError('invalid boolean literal')
+        return true
+    raise TypeError(f'column of {values.dtype} can not be casted vectorized')
+
+
+def _cast(np, base: type, values: Any) -> Any:
+    if base is bool:
+        return _cast_bool(np, values)
+    elif base is int:
+        kind = values.dtype.kind
+        if kind == 'f':
+            if not np.isfinite(values).all():
+                raise ValueError('not finite values')
+            # fractional values are truncated as by int(), values out of int64 are casted row by row
+            if ((values < -2.0 ** 63) | (values >= 2.0 ** 63)).any():
+                raise OverflowError('values out of int64 range')
+        elif kind == 'u' and (values > np.iinfo(np.int64).max).any():
+            raise OverflowError('values out of int64 range')
+        return values.astype(np.int64)
+    elif base is float:
+        return values.astype(np.float64)
+    else:
+        return values.astype(str)
+
+
+def _coerce_cells(np, plan: ValidationPlan, validator_name: str, field_plan: FieldPlan, values: Any, rows: Any, reasons: Dict[int, List[str]]) -> Tuple[Any, Any]:
+    # row-by-row fallback, produces the same errors as row validation
+    result = np.empty(len(values), dtype=object)
+    ok = np.ones(len(values), dtype=bool)
+    coercer = field_plan.coercer
+    for i, value in enumerate(values):
+        value = _item(value)
+        try:
+            result[i] = coercer(value)
+        except (ValidationError, NativeValidationError) as e:
+            ok[i] = False
+            reasons.setdefault(int(rows[i]), list()).append(f'{validator_name}({field_plan.field}) -> {str(e)}')
+        except Exception as e:
+            raise UnexpectedError(f'{validator_name}({field_plan.field}): Unexpected error with value {value}: {str(e)}') from e
+    return result, ok
+
+
+def validate_columns(plan: ValidationPlan, validator_name: str, columns: Any) -> ColumnarResult:
+    np = _numpy()
+    field_types = dict()
+    for field_plan in plan.field_plans:
+        if field_plan.validator is not None and field_plan.validator.validator is not None:
+            raise AbstractError(f'Field {field_plan.field} has nested validator and can not be validated in columnar mode')
+        field_types[field_plan] = _flat_type(field_plan)
+
+    inputs, size = _input_columns(np, plan, columns)
+    for field_plan in plan.field_plans:
+        if field_plan not in inputs and field_plan.has_default:
+            inputs[field_plan] = np.full(size, field_plan.default, dtype=object)
+
+    presence = dict()
+    for field_plan, column in inputs.items():
+        if not field_plan.readonly:
+            presence[field_plan.field] = _presence(np, column)
+
+    reasons: Dict[int, List[str]] = dict()
+    valid = _requirements_mask(np, plan.requirements, presence, size)
+    if not valid.all():
+        message = f'Given dataset does not satisfying the requirements: {plan.requirements_text}'
+        for i in (~valid).nonzero()[0]:
+            reasons.setdefault(int(i), list()).append(message)
+
+    result_columns = dict()
+    for field_plan in plan.field_plans:
+        if field_plan.field not in presence:
+            continue
+        present = presence[field_plan.field]
+        rows = present.nonzero()[0]
+        values = inputs[field_plan][rows]
+        base = field_types[field_plan]
+
+        ok = None
+        if field_plan.validator is None:
+            try:
+                casted = _cast(np, base, values)
+            except (ValueError, TypeError, OverflowError):
+                casted = None
+        else:
+            casted = None
+        if casted is None:
+            casted, ok = _coerce_cells(np, plan, validator_name, field_plan, values, rows, reasons)
+
+        data = np.empty(size, dtype=casted.dtype if casted.dtype.kind != 'U' else object)
+        mask = ~present
+        data[rows] = casted
+        if ok is not None:
+            mask[rows[~ok]] = True
+            valid[rows[~ok]] = False
+        result_columns[field_plan.name] = np.ma.MaskedArray(data, mask=mask)
+
+    if plan.combinators:
+        # combinators are user-defined functions, so they are called for each valid row
+        for i in valid.nonzero()[0]:
+            for combinator in plan.combinators:
+                names = [x.value for x in combinator.fields]
+                if all(name in result_columns and not result_columns[name].mask[i] for name in names):
+                    try:
+                        combinator.method(*(_item(result_columns[name].data[i]) for name in names))
+                    except ValidationError as e:
+                        valid[i] = False
+                        reasons.setdefault(int(i), list()).append(str(e))
+                        break
+
+    return ColumnarResult(columns=result_columns, valid=valid, reasons=reasons)
@@ -0,0 +1,205 @@
+import dataclasses
+import keyword
+import linecache
+from collections.abc import Iterable
+from operator import methodcaller
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from .abc import _EXCLUDE_MISSING
+from .lazy import LazySequence
+
+
+# model is constructed straight from slots of validation context: constructor(values, mask) returns model,
+# or None if model must be constructed with its own __init__ (e.g. to raise error for missing fields)
+Constructor = Callable[[List[Any], int], Any]
+
+
+def _is_generated_init(model: type) -> bool:
+    init = model.__dict__.get('__init__')
+    code = getattr(init, '__code__', None)
+    return code is not None and code.co_filename == '<string>' and init.__qualname__ == f'{model.__qualname__}.__init__'
+
+
+def _attribute(model: type, name: str) -> Any:
+    for class_ in model.__mro__:
+        if name in class_.__dict__:
+            return class_.__dict__[name]
+    return None
+
+
+def _dataclass_setters(model: type) -> Optional[Dict[str, Any]]:
+    # fields of regular dataclasses are written to instance dict, fields of slots dataclasses by their descriptors.
+    # models with __post_init__, custom __init__, __new__ or __setattr__ and init=False fields are constructed by __init__
+    params = getattr(model, '__dataclass_params__', None)
+    if params is None or not params.init or hasattr(model, '__post_init__') or not _is_generated_init(model):
+        return None
+    if model.__new__ is not object.__new__:
+        return None
+    if not params.frozen and model.__setattr__ is not object.__setattr__:
+        return None
+
+    model_fields = dataclasses.fields(model)
+    if any(not x.init for x in model_fields):
+        return None
+
+    setters = dict()
+    for model_field in model_fields:
+        attribute = _attribute(model, model_field.name)
+        if type(attribute).__name__ == 'member_descriptor':
+            setters[model_field.name] = attribute.__set__
+        elif hasattr(attribute, '__set__'):
+            return None
+        elif model.__dictoffset__ == 0:
+            return None
+        else:
+            setters[model_field.name] = None
+    return setters
+
+
+def _alchemy_factory(model: type) -> Optional[Tuple[Callable[[], None], Callable[[], Any]]]:
+    # declarative models with default constructor are created by class manager without __init__ and its events.
+    # only mapper's own init listener is allowed, it is replaced by configuration check.
+    # private api of sqlalchemy is used, so model is constructed by __init__ if it is changed
+    manager = getattr(model, '_sa_class_manager', None)
+    if manager is None:
+        return None
+    try:
+        from sqlalchemy.orm.decl_base import _declarative_constructor
+        from sqlalchemy.orm.mapper import _event_on_init
+        mapper = manager.mapper
+        if manager.original_init is not _declarative_constructor or mapper is None:
+            return None
+        if list(manager.dispatch.init) != [_event_on_init] or mapper._set_polymorphic_identity is not None:
+            return None
+        return mapper._check_configure, manager.new_instance
+    except (ImportError, AttributeError):
+        return None
+
+
+class _Source:
+    def __init__(self) -> None:
+        self.lines: List[str] = list()
+
+    def line(self, indent: int, text: str):
+        self.lines.append('    ' * indent + text)
+
+    def source(self) -> str:
+        return '\n'.join(self.lines) + '\n'
+
+
+# plans compiled for locally modified configurations share constructors of their model
+_CONSTRUCTORS: Dict[Any, Any] = dict()
+
+
+def constructor_for(plan: Any, context_class: type) -> Optional[Constructor]:
+    layout = tuple((x.name, x.index, x.validator is None) for x in plan.field_plans)
+    key = (plan.model, layout, id(plan.missing_value))
+    cached = _CONSTRUCTORS.get(key)
+    if cached is None:
+        # missing value is kept with constructor, so its id is not reused
+        cached = _CONSTRUCTORS[key] = (plan.missing_value, compile_constructor(plan, context_class))
+    return cached[1]
+
+
+def compile_constructor(plan: Any, context_class: type) -> Optional[Constructor]:
+    model = plan.model
+    setters = _dataclass_setters(model)
+    factory = _alchemy_factory(model) if setters is None else None
+    if setters is None and factory is None:
+        return None
+
+    namespace: Dict[str, Any] = dict(
+        MODEL=model,
+        NEW=object.__new__,
+        MISSING_VALUE=plan.missing_value,
+        ValidationContext=context_class,
+        Iterable=Iterable,
+        LazySequence=LazySequence,
+        MAP=methodcaller('map'),
+    )
+    b = _Source()
+    b.line(0, f'# generated by outpost for model {model.__qualname__}')
+    b.line(0, 'def export(value):')
+    b.line(1, 'if isinstance(value, ValidationContext):')
+    b.line(2, 'return value.map()')
+    b.line(1, 'elif isinstance(value, LazySequence):')
+    b.line(2, 'return value.exported(MAP)')
+    b.line(1, 'elif isinstance(value, Iterable) and not (isinstance(value, dict) or isinstance(value, str)):')
+    b.line(2, 'result = [x.map() if isinstance(x, ValidationContext) else x for x in value]')
+    b.line(2, 'return tuple(result) if isinstance(value, tuple) else result')
+    b.line(1, 'return value')
+    b.line(0, '')
+    b.line(0, 'def construct(values, mask):')
+
+    exclude_missing = plan.missing_value is _EXCLUDE_MISSING
+    if setters is not None:
+        defaults = dict((x.name, x) for x in dataclasses.fields(model))
+        # missing fields without defaults are reported by __init__ of model
+        required = 0
+        if exclude_missing:
+            for field_plan in plan.field_plans:
+                model_field = defaults[field_plan.name]
+                if model_field.default is dataclasses.MISSING and model_field.default_factory is dataclasses.MISSING:
+                    required |= field_plan.bit
+        if required:
+            b.line(1, f'if mask & {required} != {required}:')
+            b.line(2, 'return None')
+        b.line(1, 'obj = NEW(MODEL)')
+        if any(x is None for x in setters.values()):
+            b.line(1, 'state = obj.__dict__')
+    else:
+        namespace.update(CONFIGURE=factory[0], NEW_INSTANCE=factory[1])
+        b.line(1, 'CONFIGURE()')
+        b.line(1, 'obj = NEW_INSTANCE()')
+
+    def assign(indent: int, i: int, name: str, expression: str):
+        if setters is None:
+            if name.isidentifier() and not keyword.iskeyword(name):
+                b.line(indent, f'obj.{name} = {expression}')
+            else:
+                b.line(indent, f'setattr(obj, {name!r}, {expression})')
+        elif setters[name] is None:
+            b.line(indent, f'state[{name!r}] = {expression}')
+        else:
+            namespace[f'S_{i}'] = setters[name]
+            b.line(indent, f'S_{i}(obj, {expression})')
+
+    for i, field_plan in enumerate(plan.field_plans):
+        value = f'values[{field_plan.index}]' if field_plan.validator is None else f'export(values[{field_plan.index}])'
+        if exclude_missing:
+            if setters is None:
+                missing = None
+            else:
+                model_field = defaults[field_plan.name]
+                if model_field.default is not dataclasses.MISSING:
+                    namespace[f'D_{i}'] = model_field.default
+                    missing = f'D_{i}'
+                elif model_field.default_factory is not dataclasses.MISSING:
+                    namespace[f'D_{i}'] = model_field.default_factory
+                    missing = f'D_{i}()'
+                else:
+                    missing = None
+        else:
+            missing = 'MISSING_VALUE'
+
+        b.line(1, f'if mask & {field_plan.bit}:')
+        assign(2, i, field_plan.name, value)
+        if missing is not None:
+            b.line(1, 'else:')
+            assign(2, i, field_plan.name, missing)
+    b.line(1, 'return obj')
+
+    source = b.source()
+    filename = f'<outpost constructor {model.__qualname__}>'
+    linecache.cache[filename] = (len(source), None, source.splitlines(True), filename)
+    exec(compile(source, filename, 'exec'), namespace)
+    constructor = namespace['construct']
+    if factory is not None:
+        constructor.kind = 'sqlalchemy'
+    elif model.__dataclass_params__.frozen:
+        constructor.kind = 'frozen dataclass'
+    elif any(x is not None for x in setters.values()):
+        constructor.kind = 'slots dataclass'
+    else:
+        constructor.kind = 'dataclass'
+    return constructor
@@ -1,3 +1,6 @@
+from typing import Any, Iterable, Tuple
+
+
 class UnexpectedError(Exception):
     ...
 
@@ -10,11 +13,117 @@ class NoPromisedValidator(AbstractError):
 class FieldRequirementException(Exception):
     ...
 
+
+_ARGS = BaseException.args
+
+
+def _restore_error(class_: type, text: str, code: str, codes: Tuple[str], path: tuple) -> 'ValidationError':
+    error = class_.__new__(class_, text)
+    error.code = code
+    error._codes = codes
+    error._path = path
+    error._text = text
+    return error
+
+
 class ValidationError(Exception):
-    ...
+    # error is a leaf with message, or a list of alternatives (failed arms of union or array item).
+    # path segments are prepended by outer validators, message is rendered only when asked
+    code = 'invalid'
+    _leaf: 'ValidationError' = None
+    _alternatives: Tuple[Tuple[str, 'ValidationError']] = None
+    _segments: tuple = ()
+    _codes: Tuple[str] = None
+    _path: tuple = None
+    _text: str = None
+
+    def __init__(self, *args: Any, code: str = None) -> None:
+        super().__init__(*args)
+        if code is not None:
+            self.code = code
+
+    @classmethod
+    def alternatives(class_, errors: Iterable[Tuple[str, 'ValidationError']], *segments: Any) -> 'ValidationError':
+        error = class_()
+        error._alternatives = tuple(errors)
+        error._segments = segments
+        return error
+
+    def within(self, *segment: Any) -> 'ValidationError':
+        # segment is (validator name, field) or index of array item
+        error = ValidationError(code=self.code)
+        if self._leaf is None and self._alternatives is None:
+            error._leaf = self
+            error._segments = segment
+        else:
+            error._leaf = self._leaf
+            error._alternatives = self._alternatives
+            error._segments = segment + self._segments
+        return error
+
+    @property
+    def path(self) -> tuple:
+        if self._path is not None:
+            return self._path
+        result = tuple(x if isinstance(x, int) else x[1] for x in self._segments)
+        if self._alternatives is not None and len(self._alternatives) == 1:
+            result += self._alternatives[0][1].path
+        elif self._leaf is not None:
+            result += self._leaf.path
+        return result
+
+    @property
+    def codes(self) -> Tuple[str]:
+        if self._codes is not None:
+            return self._codes
+        elif self._alternatives is not None:
+            return tuple(code for _, error in self._alternatives for code in error.codes)
+        elif self._leaf is not None:
+            return self._leaf.codes
+        else:
+            return (self.code,)
+
+    def render(self) -> str:
+        if self._alternatives is not None:
+            text = ', '.join(f'{label}({error})' for label, error in self._alternatives)
+        elif self._leaf is not None:
+            text = str(self._leaf)
+        else:
+            text = super().__str__()
+
+        for segment in reversed(self._segments):
+            if isinstance(segment, int):
+                text = f'[{segment}]: {text}'
+            else:
+                text = f'{segment[0]}({segment[1]}) -> {text}'
+        return text
+
+    def __str__(self):
+        if self._text is None:
+            self._text = self.render()
+        return self._text
+
+    @property
+    def args(self) -> tuple:
+        # errors composed by outer validators have no args of their own, their message is rendered on access
+        if self._leaf is None and self._alternatives is None:
+            return _ARGS.__get__(self)
+        return (str(self),)
+
+    @args.setter
+    def args(self, value: tuple):
+        _ARGS.__set__(self, value)
+
+    def __repr__(self):
+        return f'{self.__class__.__name__}({", ".join(repr(x) for x in self.args)})'
+
+    def __reduce__(self):
+        # model fields are not importable, so error is pickled rendered and path is pickled as text
+        path = tuple(x if isinstance(x, int) else str(x) for x in self.path)
+        return (_restore_error, (self.__class__, str(self), self.code, self.codes, path))
 
 class NativeValidationError(ValidationError):
     ...
 
 class NotNoneError(NativeValidationError):
-    ...
\ No newline at end of file
+    ...
@@ -0,0 +1,86 @@
+from collections.abc import Sequence
+from typing import Any, Callable, Iterator, List
+
+from .exceptions import NativeValidationError, ValidationError
+
+
+# constant class to mark items that were not validated yet
+class _PENDING:
+    ...
+
+
+class LazySequence(Sequence):
+    # items of nested array are checked structurally by coercer, and validated on first access.
+    # results are cached. error of item is raised on access with path of field that owns the sequence
+    def __init__(self, items: List[Any], handler: Callable[[Any], Any], context_class: type, owner: tuple = None) -> None:
+        self.items = items
+        self.handler = handler
+        self.context_class = context_class
+        # (validator name, field)
+        self.owner = owner
+        self.results = [_PENDING] * len(items)
+
+    def __len__(self) -> int:
+        return len(self.items)
+
+    def __getitem__(self, index: Any) -> Any:
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self.items)))]
+        result = self.results[index]
+        if result is _PENDING:
+            result = self.results[index] = self.resolve(index % len(self.items))
+        return result
+
+    def __iter__(self) -> Iterator[Any]:
+        for i in range(len(self.items)):
+            yield self[i]
+
+    def resolve(self, index: int) -> Any:
+        try:
+            return self.handler(self.items[index])
+        except NativeValidationError:
+            raise
+        except ValidationError as e:
+            error = ValidationError.alternatives((('', e),), index)
+            raise error if self.owner is None else error.within(self.owner)
+
+    @property
+    def validated(self) -> int:
+        return sum(1 for x in self.results if x is not _PENDING)
+
+    def validate_all(self) -> 'LazySequence':
+        # strict mode: every item is validated, error of the first invalid item is raised
+        for _ in self:
+            pass
+        return self
+
+    def exported(self, method: Callable[[Any], Any]) -> 'LazySequence':
+        # sequence of models (or datasets) built from validated items on access
+        return _ExportedSequence(self, method)
+
+    def __eq__(self, other: Any) -> bool:
+        if isinstance(other, (list, tuple, LazySequence)):
+            return list(self) == list(other)
+        return NotImplemented
+
+    __hash__ = None
+
+    def __reduce__(self):
+        # handlers are not picklable, so sequence is sent to other processes validated, as list
+        return list, (list(self),)
+
+    def __repr__(self) -> str:
+        return f'<{self.__class__.__name__} {self.validated}/{len(self)} validated>'
+
+
+class _ExportedSequence(LazySequence):
+    def __init__(self, source: LazySequence, method: Callable[[Any], Any]) -> None:
+        super().__init__(source.items, method, source.context_class, source.owner)
+        self.source = source
+
+    def resolve(self, index: int) -> Any:
+        value = self.source[index]
+        return self.handler(value) if isinstance(value, self.context_class) else value
+
+    def exported(self, method: Callable[[Any], Any]) -> LazySequence:
+        return _ExportedSequence(self.source, method)
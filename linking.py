@@ -0,0 +1,107 @@
+import gc
+from dataclasses import dataclass, field
+from typing import Dict, List, Tuple
+
+from .abc import OutpostMeta, _PromisedValidator
+from .exceptions import AbstractError, NoPromisedValidator
+
+
+@dataclass
+class LinkResult:
+    validators: List[str] = field(default_factory=list)
+    # validators that refer to each other, directly or through other validators
+    cycles: List[Tuple[str]] = field(default_factory=list)
+    # (validator name, field, promised name) of promises that were never defined
+    unresolved: List[Tuple[str, str, str]] = field(default_factory=list)
+
+    @property
+    def ok(self) -> bool:
+        return len(self.unresolved) == 0
+
+
+def _find_cycles(graph: Dict[str, List[str]]) -> List[Tuple[str]]:
+    # strongly connected components of validators graph (Tarjan), single validator is a cycle only if it refers to itself
+    index, lowlink, stack, on_stack = dict(), dict(), list(), set()
+    result = list()
+
+    def visit(name: str):
+        index[name] = lowlink[name] = len(index)
+        stack.append(name)
+        on_stack.add(name)
+        for child in graph.get(name, ()):
+            if child not in index:
+                visit(child)
+                lowlink[name] = min(lowlink[name], lowlink[child])
+            elif child in on_stack:
+                lowlink[name] = min(lowlink[name], index[child])
+
+        if lowlink[name] == index[name]:
+            component = list()
+            while True:
+                child = stack.pop()
+                on_stack.discard(child)
+                component.append(child)
+                if child == name:
+                    break
+            if len(component) > 1 or name in graph.get(name, ()):
+                result.append(tuple(reversed(component)))
+
+    for name in graph:
+        if name not in index:
+            visit(name)
+    return result
+
+
+def link(strict: bool = False) -> LinkResult:
+    # resolves all promised validators and compiles every defined validator,
+    # so the first validation doesn't pay for compilation
+    result = LinkResult()
+    graph = dict()
+    validators = list(OutpostMeta.__validators__.items())
+
+    for name, validator in validators:
+        if validator.__config__ is None or validator.__config__.fields is None:
+            continue
+        result.validators.append(name)
+        graph[name] = children = list()
+        for field_, field_validator in validator.__config__.validators.items():
+            nested = field_validator.validator
+            if isinstance(nested, _PromisedValidator):
+                try:
+                    nested = nested.assigned_validator
+                except NoPromisedValidator:
+                    result.unresolved.append((name, str(field_), nested.name))
+                    continue
+            if nested is not None and nested.__name__ not in children:
+                children.append(nested.__name__)
+
+    if strict and result.unresolved:
+        raise NoPromisedValidator('Promised validators were never defined: ' + ', '.join(f'{name}({field_}) -> "{promised}"' for name, field_, promised in result.unresolved))
+
+    result.cycles = _find_cycles(graph)
+    if strict and result.cycles:
+        raise AbstractError('Validators refer to each other: ' + ', '.join(' -> '.join(cycle + cycle[:1]) for cycle in result.cycles))
+
+    unresolved = set(name for name, _, _ in result.unresolved)
+    for name in result.validators:
+        if name in unresolved:
+            continue
+        validator = OutpostMeta.__validators__[name]
+        plan = validator.plan
+        if plan.codegen and not plan.is_async:
+            validator.engine
+        for field_plan in plan.field_plans:
+            if field_plan.coercer is not None:
+                field_plan.coercer.link()
+
+    return result
+
+
+def warmup(strict: bool = False, freeze: bool = False) -> LinkResult:
+    # call it before fork: with freeze compiled validators are moved to permanent generation
+    # and collector of child process doesn't touch (and copy) their pages
+    result = link(strict=strict)
+    if freeze:
+        gc.collect()
+        gc.freeze()
+    return result
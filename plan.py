@@ -0,0 +1,203 @@
+from dataclasses import dataclass
+from functools import cached_property
+from types import MappingProxyType
+from types import UnionType
+from typing import Any, Callable, Iterable, Mapping, Optional, Tuple, Union, get_args, get_origin
+
+from .abc import ConfigurationFieldset, Combinator, Validator
+from .coercers import Coercer, NoneType, build_coercer
+from .constructors import Constructor, constructor_for
+from .rules import AND, NOT, OR, NoRequirements, Require, Rule
+from .serialization import compile_dumper
+from .utils import ModelField
+
+
+# constant class to mark fields without default value
+class _NO_DEFAULT:
+    ...
+
+
+# defaults of these types are passed through typecast unchanged, so there is no need to validate them per request
+_PREVALIDATED_TYPES = (int, float, str, bool)
+
+
+def _default_is_ready(annotation: type, validator: Validator, default: Any) -> bool:
+    if default is _NO_DEFAULT or validator is not None:
+        return False
+    if annotation is type(default):
+        return type(default) in _PREVALIDATED_TYPES
+
+    # Optional[X] returns None as is, and tries X as first arm
+    args = get_args(annotation)
+    if get_origin(annotation) in (Union, UnionType) and NoneType in args:
+        if default is None:
+            return True
+        return args[0] is type(default) and type(default) in _PREVALIDATED_TYPES
+    return False
+
+
+# distinct combinations of passed fields are few in practice, results are memoized up to this size
+_REQUIREMENTS_MEMO_SIZE = 1024
+
+
+def _compile_mask_rule(rule: Rule, bits: Mapping[ModelField, int]) -> Callable[[int], bool]:
+    if isinstance(rule, NoRequirements):
+        return lambda mask: True
+    elif isinstance(rule, Require):
+        bit = bits.get(rule.field, 0)
+        return lambda mask: mask & bit != 0
+    elif isinstance(rule, (AND, OR)) and all(type(x) is Require for x in rule.rules):
+        # plain sets of fields are checked with one mask operation
+        required = 0
+        for x in rule.rules:
+            required |= bits.get(x.field, 0)
+        if isinstance(rule, AND):
+            if any(x.field not in bits for x in rule.rules):
+                return lambda mask: False
+            return lambda mask: mask & required == required
+        return lambda mask: mask & required != 0
+    elif isinstance(rule, AND):
+        checks = tuple(_compile_mask_rule(x, bits) for x in rule.rules)
+        return lambda mask: all(check(mask) for check in checks)
+    elif isinstance(rule, OR):
+        checks = tuple(_compile_mask_rule(x, bits) for x in rule.rules)
+        return lambda mask: any(check(mask) for check in checks)
+    elif isinstance(rule, NOT):
+        check = _compile_mask_rule(rule.rule, bits)
+        return lambda mask: not check(mask)
+    else:
+        # user-defined rules are checked against list of passed fields
+        return lambda mask: rule.check([field for field, bit in bits.items() if mask & bit])
+
+
+def compile_requirements(rule: Rule, bits: Mapping[ModelField, int]) -> Callable[[int], bool]:
+    # predicate over presence mask, bit of field is its position in ModelField
+    check = _compile_mask_rule(rule, bits)
+    if isinstance(rule, NoRequirements):
+        return check
+
+    memo = dict()
+
+    def requirements_mask(mask: int) -> bool:
+        try:
+            return memo[mask]
+        except KeyError:
+            result = memo[mask] = check(mask)
+            if len(memo) > _REQUIREMENTS_MEMO_SIZE:
+                memo.clear()
+            return result
+
+    return requirements_mask
+
+
+def presence_mask(bits: Mapping[ModelField, int], passed: Iterable[ModelField]) -> int:
+    mask = 0
+    for field in passed:
+        mask |= bits.get(field, 0)
+    return mask
+
+
+@dataclass(frozen=True, eq=False)
+class FieldPlan:
+    field: ModelField
+    name: str
+    # position of field in ModelField: index of slot in dataset and bit in presence mask
+    index: int
+    bit: int
+    annotation: type
+    validator: Optional[Validator]
+    coercer: Coercer
+    readonly: bool
+    default: Any
+    default_ready: bool
+
+    @property
+    def has_default(self) -> bool:
+        return self.default is not _NO_DEFAULT
+
+
+@dataclass(frozen=True)
+class ValidationPlan:
+    config: ConfigurationFieldset
+    model: Any
+    fields: ModelField
+    field_plans: Tuple[FieldPlan]
+    by_field: Mapping[ModelField, FieldPlan]
+    missing_value: Any
+    raise_readonly: bool
+    raise_unnecessary: bool
+    codegen: bool
+    is_async: bool
+    readonly: frozenset
+    readonly_mask: int
+    defaults: Mapping[ModelField, Any]
+    validators: Mapping[ModelField, Validator]
+    combinators: Tuple[Combinator]
+    requirements: Rule
+    requirements_text: str
+    requirements_mask: Callable[[int], bool]
+    field_bits: Mapping[ModelField, int]
+    annotations: Mapping[ModelField, type]
+
+    @classmethod
+    def compile(class_, config: ConfigurationFieldset, name: str = '') -> 'ValidationPlan':
+        readonly = frozenset(config.readonly)
+        defaults = dict(config.defaults)
+        validators = dict(config.validators)
+        annotation_generator = config.__annotation_generator__
+
+        field_plans = list()
+        for index, field in enumerate(config.fields):
+            annotation = annotation_generator.get_annotation(field)
+            validator = validators.get(field)
+            default = defaults.get(field, _NO_DEFAULT)
+            field_plans.append(FieldPlan(
+                field=field,
+                name=field.value,
+                index=index,
+                bit=1 << index,
+                annotation=annotation,
+                validator=validator,
+                coercer=build_coercer(annotation, validator, (name, field) if validator is not None and validator.lazy else None),
+                readonly=field in readonly,
+                default=default,
+                default_ready=_default_is_ready(annotation, validator, default),
+            ))
+
+        requirements = config.requirements
+        field_bits = dict((x.field, x.bit) for x in field_plans)
+        return class_(
+            config=config,
+            model=config.model,
+            fields=config.fields,
+            field_plans=tuple(field_plans),
+            by_field=MappingProxyType(dict((x.field, x) for x in field_plans)),
+            missing_value=config.missing_value,
+            raise_readonly=config.raise_readonly,
+            raise_unnecessary=config.raise_unnecessary,
+            codegen=config.codegen,
+            is_async=any(x.is_async for x in validators.values()) or any(x.is_async for x in config.combinators),
+            readonly=readonly,
+            readonly_mask=sum(x.bit for x in field_plans if x.readonly),
+            defaults=MappingProxyType(defaults),
+            validators=MappingProxyType(validators),
+            combinators=tuple(config.combinators),
+            requirements=requirements,
+            requirements_text=requirements.text_rule(),
+            requirements_mask=compile_requirements(requirements, field_bits),
+            field_bits=MappingProxyType(field_bits),
+            annotations=MappingProxyType(dict((x.field, x.annotation) for x in field_plans)),
+        )
+
+    @cached_property
+    def constructor(self) -> Optional[Constructor]:
+        # compiled on first mapping, because sqlalchemy mappers are configured lazily
+        from .types import ValidationContext
+        return constructor_for(self, ValidationContext)
+
+    @cached_property
+    def dumper(self) -> Callable[[Any], Any]:
+        return compile_dumper(self)
+
+    def requirements_check(self, passed: Iterable[ModelField]) -> bool:
+        return self.requirements_mask(presence_mask(self.field_bits, passed))
@@ -0,0 +1,186 @@
+import marshal
+import threading
+from contextlib import contextmanager
+from dataclasses import dataclass
+from time import perf_counter
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+
+from .coercers import getname
+from .utils import ModelField
+
+
+@dataclass(frozen=True)
+class ProfileEvent:
+    validator: str
+    # stage of ValidationContext, or kind of field validation: 'validator', 'nested' or 'coerce'
+    stage: str
+    elapsed: float
+    field: Optional[ModelField] = None
+    # user-defined function, nested validator or annotation of field
+    target: Any = None
+
+    @property
+    def label(self) -> str:
+        if self.field is None:
+            return f'{self.validator}.{self.stage}'
+        return f'{self.validator}({self.field}) {self.stage} {getname(self.target)}'
+
+
+@dataclass
+class AggregatedStats:
+    count: int = 0
+    total: float = 0.0
+    min: float = None
+    max: float = None
+
+    @property
+    def mean(self) -> float:
+        return self.total / self.count if self.count else 0.0
+
+    def add(self, elapsed: float):
+        self.count += 1
+        self.total += elapsed
+        self.min = elapsed if self.min is None else min(self.min, elapsed)
+        self.max = elapsed if self.max is None else max(self.max, elapsed)
+
+
+class Aggregator:
+    # in-memory sink: stats of events grouped by label
+    def __init__(self) -> None:
+        self.stats: Dict[str, AggregatedStats] = dict()
+        self.lock = threading.Lock()
+
+    def __call__(self, event: ProfileEvent):
+        with self.lock:
+            stats = self.stats.get(event.label)
+            if stats is None:
+                stats = self.stats[event.label] = AggregatedStats()
+            stats.add(event.elapsed)
+
+    def clear(self):
+        with self.lock:
+            self.stats.clear()
+
+    def report(self, limit: int = None) -> str:
+        # time of nested validator includes stages of its own validation
+        with self.lock:
+            items = sorted(self.stats.items(), key=lambda x: x[1].total, reverse=True)[:limit]
+        lines = [f'{"total ms":>10} {"count":>8} {"mean us":>10} {"max us":>10}  label']
+        for label, stats in items:
+            lines.append(f'{stats.total * 1e3:10.3f} {stats.count:8} {stats.mean * 1e6:10.1f} {stats.max * 1e6:10.1f}  {label}')
+        return '\n'.join(lines)
+
+
+class PstatsSink:
+    # cProfile compatible summary: pstats.Stats(sink) or sink.dump_stats(path) for python -m pstats and snakeviz.
+    # user-defined validators are reported with their own file and line
+    def __init__(self) -> None:
+        self.calls: Dict[Tuple[str, int, str], List[Any]] = dict()
+        self.stats = dict()
+        self.lock = threading.Lock()
+
+    @staticmethod
+    def key(event: ProfileEvent) -> Tuple[str, int, str]:
+        code = getattr(event.target, '__code__', None)
+        if event.stage == 'validator' and code is not None:
+            return code.co_filename, code.co_firstlineno, event.target.__qualname__
+        return 'outpost', 0, event.label
+
+    def __call__(self, event: ProfileEvent):
+        key = self.key(event)
+        with self.lock:
+            calls = self.calls.get(key)
+            if calls is None:
+                calls = self.calls[key] = [0, 0.0]
+            calls[0] += 1
+            calls[1] += event.elapsed
+
+    def create_stats(self):
+        # times are inclusive, so own time is equal to cumulative time
+        with self.lock:
+            self.stats = dict((key, (count, count, total, total, {})) for key, (count, total) in self.calls.items())
+
+    def dump_stats(self, path: str):
+        self.create_stats()
+        with open(path, 'wb') as file:
+            marshal.dump(self.stats, file)
+
+
+class Profiler:
+    def __init__(self, sinks: Tuple[Callable[[ProfileEvent], Any]], sample: float = 1.0) -> None:
+        if not 0 < sample <= 1:
+            raise ValueError('sample must be in range (0, 1]')
+        self.sinks = sinks
+        # every n-th validation is profiled
+        self.every = max(1, round(1 / sample))
+        self.counter = 0
+        self.local = threading.local()
+
+    def sampled(self) -> bool:
+        self.counter += 1
+        return self.counter % self.every == 0
+
+    @property
+    def is_recording(self) -> bool:
+        return getattr(self.local, 'depth', 0) > 0
+
+    @contextmanager
+    def recording(self) -> Iterator['Profiler']:
+        # nested validators are profiled only inside of sampled validation
+        self.local.depth = getattr(self.local, 'depth', 0) + 1
+        try:
+            yield self
+        finally:
+            self.local.depth -= 1
+
+    def emit(self, event: ProfileEvent):
+        for sink in self.sinks:
+            sink(event)
+
+    def stage(self, validator: str, stage: str, method: Callable, *args: Any) -> Any:
+        start = perf_counter()
+        try:
+            return method(*args)
+        finally:
+            self.emit(ProfileEvent(validator, stage, perf_counter() - start))
+
+    def field(self, validator: str, field_plan: Any, value: Any) -> Any:
+        user_validator = field_plan.validator
+        if user_validator is None:
+            stage, target = 'coerce', field_plan.annotation
+        elif user_validator.method is not None:
+            stage, target = 'validator', user_validator.method
+        else:
+            stage, target = 'nested', user_validator.validator
+
+        start = perf_counter()
+        try:
+            return field_plan.coercer(value)
+        finally:
+            self.emit(ProfileEvent(validator, stage, perf_counter() - start, field_plan.field, target))
+
+
+# profiler is checked once per validation, so disabled profiling costs one attribute lookup
+current: Optional[Profiler] = None
+
+
+def enable(*sinks: Callable[[ProfileEvent], Any], sample: float = 1.0) -> Profiler:
+    global current
+    current = Profiler(sinks, sample)
+    return current
+
+
+def disable():
+    global current
+    current = None
+
+
+@contextmanager
+def profile(*sinks: Callable[[ProfileEvent], Any], sample: float = 1.0) -> Iterator[Profiler]:
+    global current
+    previous = current
+    profiler = current = Profiler(sinks, sample)
+    try:
+        yield profiler
+    finally:
+        current = previous
@@ -18,6 +18,13 @@ class Rule(ABC):
     def text_rule(self):
         ...
 
+    def check(self, passed_fields: Iterable[str]) -> bool:
+        try:
+            self.resolve(passed_fields)
+        except FieldRequirementException:
+            return False
+        return True
+
     def __or__(self, other):
         if isinstance(self, OR):
             return OR(*self.rules, other)
@@ -35,6 +42,9 @@ class NoRequirements(Rule):
     def resolve(self, _):
         ...
 
+    def check(self, _):
+        return True
+
     def text_rule(self):
         return ''
 
@@ -50,8 +60,11 @@ class Require(Rule):
     def field(self):
         return self._field
 
+    def check(self, passed_fields: Iterable[str]) -> bool:
+        return self.field in passed_fields
+
     def resolve(self, passed_fields: Iterable[str]):
-        if not (self.field in passed_fields):
+        if not self.check(passed_fields):
             raise FieldRequirementException(f"Field {self.text_rule()} required")
 
     def text_rule(self):
@@ -81,29 +94,23 @@ class _RequireMany(Rule):
 
 
 class OR(_RequireMany):
+    def check(self, passed_fields: Iterable[str]) -> bool:
+        return any(rule.check(passed_fields) for rule in self.rules)
+
     def resolve(self, passed_fields: Iterable[str]):
-        for rule in self.rules:
-            try:
-                rule.resolve(passed_fields)
-            except FieldRequirementException as e:
-                continue
-            else:
-                return None
-        else:
+        if not self.check(passed_fields):
             raise FieldRequirementException(f'Fields requirement rule: {self.text_rule()}')
 
     def text_rule(self):
         return '(' + ' OR '.join(rule.text_rule() for rule in self.rules) + ')'
 
 class AND(_RequireMany):
+    def check(self, passed_fields: Iterable[str]) -> bool:
+        return all(rule.check(passed_fields) for rule in self.rules)
+
     def resolve(self, passed_fields: Iterable[str]):
-        for rule in self.rules:
-            try:
-                rule.resolve(passed_fields)
-            except FieldRequirementException as e:
-                raise FieldRequirementException(f'Fields requirement rule: {self.text_rule()}')
-            else:
-                continue
+        if not self.check(passed_fields):
+            raise FieldRequirementException(f'Fields requirement rule: {self.text_rule()}')
 
     def text_rule(self):
         return '(' + ' AND '.join(rule.text_rule() for rule in self.rules) + ')'
@@ -122,12 +129,11 @@ class NOT(Rule):
     def rule(self):
         return self._rule
 
+    def check(self, passed_fields: Iterable[str]) -> bool:
+        return not self.rule.check(passed_fields)
+
     def resolve(self, passed_fields: Iterable[str]):
-        try:
-            self.rule.resolve(passed_fields)
-        except FieldRequirementException:
-            pass
-        else:
+        if not self.check(passed_fields):
             raise FieldRequirementException(f"Fields requirement rule: {self.text_rule()}")
 
     def text_rule(self):
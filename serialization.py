@@ -0,0 +1,213 @@
+import dataclasses
+import datetime
+import decimal
+import enum
+import json
+import keyword
+import linecache
+import uuid
+from typing import Any, Callable, Dict, List, Optional, get_args
+
+from .abc import Validator
+from .coercers import NoneType, is_array, is_union
+from .lazy import LazySequence
+
+
+# encoder returns JSON compatible value, None instead of encoder means that value is emitted as is
+Encoder = Callable[[Any], Any]
+
+_NATIVE_TYPES = (str, int, float, bool, NoneType)
+_ARRAY_TYPES = (list, tuple, set, frozenset, LazySequence)
+
+
+def _isoformat(value: Any) -> str:
+    return value.isoformat()
+
+
+def _enum_value(value: enum.Enum) -> Any:
+    return encode(value.value)
+
+
+def _encode_array(value: Any) -> List[Any]:
+    return [encode(x) for x in value]
+
+
+def _encode_mapping(value: dict) -> dict:
+    return dict((key, encode(x)) for key, x in value.items())
+
+
+def _encode_dataclass(value: Any) -> dict:
+    # unlike dataclasses.asdict, values are not deep copied
+    return dict((x.name, encode(getattr(value, x.name))) for x in dataclasses.fields(value))
+
+
+def _encoder_of_type(type_: type) -> Optional[Encoder]:
+    if type_ in _NATIVE_TYPES:
+        return None
+    elif issubclass(type_, enum.Enum):
+        return _enum_value
+    elif issubclass(type_, (datetime.date, datetime.time)):
+        return _isoformat
+    elif issubclass(type_, (uuid.UUID, decimal.Decimal)):
+        return str
+    elif issubclass(type_, _ARRAY_TYPES):
+        return _encode_array
+    elif issubclass(type_, dict):
+        return _encode_mapping
+    elif dataclasses.is_dataclass(type_):
+        return _encode_dataclass
+    # values of unknown types are left to JSON encoder
+    return None
+
+
+# encoders of runtime types, used where annotation doesn't tell the type of value
+_BY_TYPE: Dict[type, Optional[Encoder]] = dict()
+
+
+def encode(value: Any) -> Any:
+    type_ = value.__class__
+    try:
+        encoder = _BY_TYPE[type_]
+    except KeyError:
+        encoder = _BY_TYPE[type_] = _encoder_of_type(type_)
+    return value if encoder is None else encoder(value)
+
+
+def _optional(encoder: Encoder) -> Encoder:
+    return lambda value: None if value is None else encoder(value)
+
+
+def _array(encoder: Encoder) -> Encoder:
+    return lambda value: [encoder(x) for x in value]
+
+
+class _NestedDumper:
+    # nested validator is resolved on first call, because promised validators may be defined later
+    def __init__(self, validator: Any) -> None:
+        self.validator = validator
+        self.dumper = None
+
+    def __call__(self, value: Any) -> Any:
+        dumper = self.dumper
+        if dumper is None:
+            dumper = self.dumper = self.validator.plan.dumper
+        return dumper(value)
+
+
+def build_encoder(annotation: Any, validator: Optional[Validator] = None) -> Optional[Encoder]:
+    if validator is not None:
+        if validator.validator is not None:
+            # dumper of nested validator handles None and arrays of nested models
+            return _NestedDumper(validator.validator)
+        elif not validator.check_result_type:
+            return encode
+
+    # annotation is not enforced for None (missing value, default, unchecked result), so typed encoders skip it
+    if annotation in _NATIVE_TYPES:
+        return None
+    elif is_union(annotation):
+        args = tuple(arg for arg in get_args(annotation) if not (arg is NoneType or arg is None))
+        if all(arg in _NATIVE_TYPES for arg in args):
+            return None
+        elif len(args) == 1:
+            return build_encoder(args[0])
+        return encode
+    elif is_array(annotation):
+        args = tuple(arg for arg in get_args(annotation) if arg is not Ellipsis)
+        if len(args) == 1:
+            encoder = build_encoder(args[0])
+            if encoder is None:
+                # arrays are copied, so dumped dataset doesn't share them with model
+                return _optional(list)
+            elif encoder is not encode:
+                return _optional(_array(encoder))
+        return _optional(_encode_array)
+    elif isinstance(annotation, type):
+        encoder = _encoder_of_type(annotation)
+        if encoder in (_enum_value, _isoformat, str):
+            return _optional(encoder)
+    # values of containers, dataclasses without validator and unknown types are encoded by their runtime type
+    return encode
+
+
+def _is_relationship(annotation: Any) -> bool:
+    # sqlalchemy relationships are dumped only with nested validator, otherwise they are lazy loaded and may refer back
+    if is_union(annotation) or is_array(annotation):
+        return any(_is_relationship(arg) for arg in get_args(annotation))
+    return hasattr(annotation, '_sa_class_manager')
+
+
+class _Source:
+    def __init__(self) -> None:
+        self.lines: List[str] = list()
+
+    def line(self, indent: int, text: str):
+        self.lines.append('    ' * indent + text)
+
+    def source(self) -> str:
+        return '\n'.join(self.lines) + '\n'
+
+
+def compile_dumper(plan: Any) -> Callable[[Any], Any]:
+    # dumper accepts mapped model, validated dataset (dict by field names), or array of them
+    # missing value can not be told from the same value of present field (interned '' or 0), so it is emitted as is.
+    # only keys absent in dataset are skipped
+    namespace: Dict[str, Any] = dict(
+        LazySequence=LazySequence,
+        NO_VALUE=object(),
+    )
+
+    expressions = list()
+    for i, field_plan in enumerate(plan.field_plans):
+        if _is_relationship(field_plan.annotation) and (field_plan.validator is None or field_plan.validator.validator is None):
+            continue
+        encoder = build_encoder(field_plan.annotation, field_plan.validator)
+        if encoder is not None:
+            namespace[f'E_{i}'] = encoder
+        expressions.append((i, field_plan.name, encoder is not None))
+
+    def encoded(i: int, has_encoder: bool, value: str) -> str:
+        return f'E_{i}({value})' if has_encoder else value
+
+    b = _Source()
+    b.line(0, f'# generated by outpost for model {getattr(plan.model, "__qualname__", plan.model)}')
+    b.line(0, 'def dump_object(obj):')
+    b.line(1, 'return {')
+    for i, name, has_encoder in expressions:
+        attribute = f'obj.{name}' if name.isidentifier() and not keyword.iskeyword(name) else f'getattr(obj, {name!r})'
+        b.line(2, f'{name!r}: {encoded(i, has_encoder, attribute)},')
+    b.line(1, '}')
+    b.line(0, '')
+
+    b.line(0, 'def dump_mapping(obj):')
+    b.line(1, 'result = {}')
+    for i, name, has_encoder in expressions:
+        b.line(1, f'value = obj.get({name!r}, NO_VALUE)')
+        b.line(1, 'if value is not NO_VALUE:')
+        b.line(2, f'result[{name!r}] = {encoded(i, has_encoder, "value")}')
+    b.line(1, 'return result')
+    b.line(0, '')
+
+    b.line(0, 'def dump(value):')
+    b.line(1, 'if value is None:')
+    b.line(2, 'return None')
+    b.line(1, 'elif isinstance(value, dict):')
+    b.line(2, 'return dump_mapping(value)')
+    b.line(1, 'elif isinstance(value, (list, tuple, LazySequence)):')
+    b.line(2, 'return [dump(x) for x in value]')
+    b.line(1, 'return dump_object(value)')
+
+    source = b.source()
+    filename = f'<outpost dumper {getattr(plan.model, "__qualname__", plan.model)}>'
+    linecache.cache[filename] = (len(source), None, source.splitlines(True), filename)
+    exec(compile(source, filename, 'exec'), namespace)
+    dumper = namespace['dump']
+    dumper.source = source
+    return dumper
+
+
+_JSON_ENCODER = json.JSONEncoder(ensure_ascii=False, separators=(',', ':'))
+
+
+def dump_json(value: Any) -> str:
+    return _JSON_ENCODER.encode(value)
@@ -0,0 +1,138 @@
+import csv
+import json
+import re
+from itertools import chain
+from typing import Any, Callable, Iterable, Iterator, Optional, Tuple, Union
+
+from .exceptions import AbstractError, NativeValidationError
+from .utils import ModelField
+
+
+NDJSON = 'ndjson'
+CSV = 'csv'
+
+_DECODER = json.JSONDecoder()
+_WHITESPACE = re.compile(r'[ \t\n\r]*')
+
+
+def _text_lines(source: Iterable[Union[str, bytes]], encoding: str) -> Iterator[str]:
+    for line in source:
+        if isinstance(line, (bytes, bytearray)):
+            line = line.decode(encoding)
+        yield line
+
+
+def _peek_format(lines: Iterator[str]) -> Tuple[str, Iterator[str]]:
+    skipped = list()
+    for line in lines:
+        skipped.append(line)
+        stripped = line.lstrip()
+        if stripped:
+            return (NDJSON if stripped.startswith('{') else CSV), chain(skipped, lines)
+    return NDJSON, iter(skipped)
+
+
+def decode_ndjson(line: str) -> Any:
+    try:
+        return json.loads(line)
+    except ValueError as e:
+        raise NativeValidationError(f'Invalid JSON: {str(e)}', code='json')
+
+
+def json_text(data: Union[str, bytes, bytearray, memoryview], encoding: str = 'utf-8') -> str:
+    if isinstance(data, str):
+        return data
+    if isinstance(data, (bytes, bytearray, memoryview)):
+        try:
+            # memoryview is decoded without copying to bytes
+            return str(data, encoding)
+        except UnicodeDecodeError as e:
+            raise NativeValidationError(f'Invalid JSON: {str(e)}', code='json')
+    raise NativeValidationError('Invalid typecast. JSON document required.', code='typecast')
+
+
+def json_start(text: str) -> int:
+    # position of first significant character of document
+    return _WHITESPACE.match(text, 0).end()
+
+
+def decode_json(text: str, start: int = 0) -> Any:
+    try:
+        result, end = _DECODER.raw_decode(text, start)
+    except ValueError as e:
+        raise NativeValidationError(f'Invalid JSON: {str(e)}', code='json')
+    if _WHITESPACE.match(text, end).end() != len(text):
+        raise NativeValidationError(f'Invalid JSON: Extra data at char {end}', code='json')
+    return result
+
+
+def json_array_items(text: str, start: int) -> Iterator[Any]:
+    # items of top-level array are decoded one by one, so only one of them is kept decoded at a time.
+    # malformed document stops iteration with error, because position of next item is unknown
+    skip = _WHITESPACE.match
+    end = len(text)
+    index = skip(text, start + 1).end()
+    if text.startswith(']', index):
+        index = skip(text, index + 1).end()
+    else:
+        while True:
+            try:
+                item, index = _DECODER.raw_decode(text, index)
+            except ValueError as e:
+                raise NativeValidationError(f'Invalid JSON: {str(e)}', code='json')
+            yield item
+
+            index = skip(text, index).end()
+            if text.startswith(',', index):
+                index = skip(text, index + 1).end()
+            elif text.startswith(']', index):
+                index = skip(text, index + 1).end()
+                break
+            else:
+                raise NativeValidationError(f'Invalid JSON: Expecting \',\' or \']\' delimiter at char {index}', code='json')
+    if index != end:
+        raise NativeValidationError(f'Invalid JSON: Extra data at char {index}', code='json')
+
+
+def ndjson_records(lines: Iterable[str]) -> Iterator[str]:
+    # records are decoded by validation pipeline, so malformed line is reported as row error
+    for line in lines:
+        if line.strip():
+            yield line
+
+
+def csv_records(lines: Iterable[str], fields: ModelField, **fmtparams) -> Iterator[dict]:
+    reader = csv.reader(lines, **fmtparams)
+    try:
+        header = next(reader)
+    except StopIteration:
+        return
+
+    # header columns are mapped to model fields, unknown columns are kept as is
+    columns = list()
+    for column in header:
+        column = column.strip()
+        try:
+            columns.append(fields(column))
+        except ValueError:
+            columns.append(column)
+
+    for row in reader:
+        if not row:
+            continue
+        # empty cells are treated as missing values
+        yield dict((column, value) for column, value in zip(columns, row) if value != '')
+
+
+def iter_records(source: Iterable[Union[str, bytes]], fields: ModelField, format: Optional[str] = None,
+                 encoding: str = 'utf-8', **fmtparams) -> Tuple[Iterator[Any], Callable[[Any], Any]]:
+    lines = _text_lines(source, encoding)
+    if format is None:
+        format, lines = _peek_format(lines)
+
+    if format == NDJSON:
+        return ndjson_records(lines), decode_ndjson
+    elif format == CSV:
+        return csv_records(lines, fields, **fmtparams), lambda record: record
+    else:
+        raise AbstractError(f'Unsupported stream format "{format}". Use "{NDJSON}" or "{CSV}".')
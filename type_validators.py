@@ -1,4 +1,7 @@
 from typing import *
+from typing import get_origin
+from types import UnionType
+from collections.abc import Iterable as IterableABC, Callable as CallableABC
 from abc import ABC, abstractmethod
 from dataclasses import MISSING, fields
 
@@ -24,43 +27,36 @@ class ABCTypeValidator(ABC):
 
 class TypingModuleValidator:
 
-    STR_ALIASES = {
-        Union: str(Union),
-        Iterable : str(Iterable),
-        Optional: str(Optional),
-        Callable : str(Callable),
-        Any : str(Any),
+    ORIGIN_ALIASES = {
+        Union: '_is_union_instance',
+        UnionType: '_is_union_instance',
+        IterableABC: '_is_iterable_instance',
+        list: '_is_iterable_instance',
+        tuple: '_is_iterable_instance',
+        CallableABC: '_is_callable_instance',
     }
 
-    def _is_supported_alias(self, annotation : str):
-        for str_alias in self.STR_ALIASES.values():
-            if annotation.startswith(str_alias):
-                return True
-        return False
+    def _is_supported_alias(self, annotation: type):
+        return annotation is Any or get_origin(annotation) in self.ORIGIN_ALIASES
+
+    def _is_typing_alias(self, annotation: type):
+        return annotation is Any or get_origin(annotation) is not None
 
-    def _is_typing_alias(self, annotation: str):
-        str_aliases = self.STR_ALIASES.values()
-        prefixes = [alias[:alias.find('.')] for alias in str_aliases]
-        return annotation.startswith(tuple(prefixes))
-
-    def _get_alias_method(self, annotation: str):
-        if annotation.startswith(self.STR_ALIASES[Union]) or annotation.startswith(self.STR_ALIASES[Optional]):
-            return self._is_union_instance
-        elif annotation.startswith(self.STR_ALIASES[Iterable]):
-            return self._is_iterable_instance
-        elif annotation.startswith(self.STR_ALIASES[Callable]):
-            return self._is_callable_instance
-        elif annotation.startswith(self.STR_ALIASES[Any]):
+    def _get_alias_method(self, annotation: type):
+        if annotation is Any:
             return self._is_any_instance
+        method = self.ORIGIN_ALIASES.get(get_origin(annotation))
+        if method is not None:
+            return getattr(self, method)
 
     def _is_callable_instance(self, value, _type: type):
         return callable(value)
 
     def _is_instance(self, value : Any, _type : type) -> bool:
-        if self._is_typing_alias(str(_type)):
-            if not self._is_supported_alias(str(_type)):
+        if self._is_typing_alias(_type):
+            if not self._is_supported_alias(_type):
                 raise Exception(f'Тип {_type} не поддерживается')
-            method = self._get_alias_method(str(_type))
+            method = self._get_alias_method(_type)
             if method is not None:
                 return method(value, _type)
             else:
@@ -112,3 +108,7 @@ class DataclassTypeValidator(TypingModuleValidator, ABCTypeValidator):
 
     def get_missing(self):
         return MISSING
+
+
+# shared stateless instance, used to check results of user-defined validators
+TYPE_VALIDATOR = TypingModuleValidator()
@@ -1,17 +1,31 @@
+import asyncio
+import copy
+import inspect
+from collections.abc import Iterable as IterableABC
 from typing import Iterable
+from concurrent.futures import Executor, ProcessPoolExecutor
 from dataclasses import fields, is_dataclass
-from typing import Any, Union, Dict
+from typing import Any, Callable, Iterator, List, Optional, Tuple, Union, Dict
 
-from .type_validators import TypingModuleValidator
+from .coercers import build_coercer, getname, is_array, is_union
 from .deprecation import deprecated
 
 from .rules import AND, Rule, Require, NoRequirements
 from .utils import ModelField
 
 
-from .abc import GenericValidatorProvider, TOriginalModel, ABCOutpost, RWConfiguration, Validator, Combinator, _EXCLUDE_MISSING, IFieldGenerator, IAnnotationGenerator
+from .abc import GenericValidatorProvider, TOriginalModel, ABCOutpost, RWConfiguration, Validator, ValidatorCache, Combinator, _EXCLUDE_MISSING, IFieldGenerator, IAnnotationGenerator
+from .classproperty import classproperty
+from .plan import ValidationPlan
+from .codegen import CodegenEngine
+from .batch import BatchResult, RowError, iter_batch, run_batch, run_parallel
+from .streaming import decode_json, iter_records, json_array_items, json_start, json_text
+from .columnar import ColumnarResult, validate_columns
+from .lazy import LazySequence
+from .serialization import dump_json
+from . import profiling
 
-from .exceptions import AbstractError, FieldRequirementException, NativeValidationError, UnexpectedError, ValidationError, NotNoneError
+from .exceptions import AbstractError, NativeValidationError, UnexpectedError, ValidationError
 
 
 class DataclassFieldGenerator(IFieldGenerator):
@@ -45,12 +59,27 @@ class OutpostProvider(GenericValidatorProvider):
         else:
             self.requirements.append_rules(new_rule)
 
-    def validator(self, field: ModelField, validator: 'Outpost' = None, check_result_type: bool = True):
+    def validator(self, field: ModelField, validator: 'Outpost' = None, check_result_type: bool = True, cache: int = None, lazy: bool = False):
+        if cache is not None and (not isinstance(cache, int) or isinstance(cache, bool) or cache <= 0):
+            raise AbstractError(f'Cache size of validator for field {field} must be positive integer')
         if validator is not None:
-            self.validators[field] = Validator(validator=validator, check_result_type=check_result_type)
+            if cache is not None:
+                raise AbstractError(f'Nested validator of field {field} can not be cached')
+            self.validators[field] = Validator(validator=validator, check_result_type=check_result_type, lazy=lazy)
         else:
+            if lazy:
+                raise AbstractError(f'Only arrays of nested models can be validated lazily, but field {field} has no nested validator')
             def decorator(func):
-                self.validators[field] = Validator(method=func, check_result_type=check_result_type)
+                if cache is not None and inspect.iscoroutinefunction(func):
+                    raise AbstractError(f'Async validator of field {field} can not be cached')
+                validator_cache = ValidatorCache(cache) if cache is not None else None
+                self.validators[field] = Validator(method=func, check_result_type=check_result_type, cache=validator_cache)
+                if validator_cache is not None:
+                    try:
+                        func.cache_info = validator_cache.info
+                        func.cache_clear = validator_cache.clear
+                    except AttributeError:
+                        pass
                 return func
 
             return decorator
@@ -85,6 +114,7 @@ class OutpostProvider(GenericValidatorProvider):
         self.missing_value = _EXCLUDE_MISSING
         self.raise_readonly = False
         self.raise_unnecessary = False
+        self.codegen = False
         self.readonly = list()
         self.defaults = dict()
         self.validators = dict()
@@ -95,6 +125,7 @@ class OutpostProvider(GenericValidatorProvider):
         return f'<{self.__class__.__qualname__} object>\n'+\
             f'\traise unnecessary: {self.raise_unnecessary}\n'+\
             f'\traise readonly: {self.raise_readonly}\n'+\
+            f'\tcodegen: {self.codegen}\n'+\
             f'\tmissing value: {self.missing_value}\n'+\
             f'\treadonly: {[f"{x}" for x in self.readonly]}\n'+\
             f'\tdefaults: {[f"{x[0]}: {x[1]}" for x in self.defaults.items()]}\n'+\
@@ -122,28 +153,145 @@ class OutpostProvider(GenericValidatorProvider):
 
 
 
+# constant class to mark values missing in incoming dataset
+class _NO_VALUE:
+    ...
+
+
+def _same_raw(a: Any, b: Any) -> bool:
+    # raw values are compared with their types, because 1 == 1.0 == True may be casted differently
+    if a is b:
+        return True
+    if type(a) is not type(b):
+        return False
+    if isinstance(a, dict):
+        return len(a) == len(b) and all(key in b and _same_raw(value, b[key]) for key, value in a.items())
+    if isinstance(a, (list, tuple)):
+        return len(a) == len(b) and all(_same_raw(x, y) for x, y in zip(a, b))
+    return a == b
+
+
+def _snapshot(value: Any) -> Any:
+    # containers of raw values are copied, so dataset mutated in place by caller is detected as changed.
+    # constructors of subclasses (defaultdict, namedtuple) have own signatures, so copies are filled item by item
+    if isinstance(value, dict):
+        result = copy.copy(value)
+        for key, x in value.items():
+            result[key] = _snapshot(x)
+        return result
+    if isinstance(value, list):
+        result = copy.copy(value)
+        for i, x in enumerate(value):
+            result[i] = _snapshot(x)
+        return result
+    if isinstance(value, tuple):
+        items = [_snapshot(x) for x in value]
+        if all(x is y for x, y in zip(items, value)):
+            return value
+        # tuple of unknown subclass is kept as plain tuple, it is never same as raw value, so field is validated again
+        return value._make(items) if hasattr(value, '_make') else tuple(items)
+    if isinstance(value, set):
+        return value.copy()
+    return value
+
+
+def _config_state(config: RWConfiguration) -> Tuple[tuple, tuple]:
+    # settings and items of containers, compared by identity to detect modification of exposed configuration
+    containers = (config.readonly, config.defaults, config.validators, config.combinators)
+    items = [config.missing_value, config.raise_readonly, config.raise_unnecessary, config.codegen, config.requirements]
+    for container in containers:
+        if isinstance(container, dict):
+            for key, value in container.items():
+                items.append(key)
+                items.append(value)
+        else:
+            items.extend(container)
+    return tuple(len(x) for x in containers), tuple(items)
+
+
+def _same_state(a: Tuple[tuple, tuple], b: Tuple[tuple, tuple]) -> bool:
+    return a[0] == b[0] and all(x is y for x, y in zip(a[1], b[1]))
+
+
 class ValidationContext:
     
 
-    def __init__(self, config: RWConfiguration, parent_validator_name:str = "") -> None:
+    def __init__(self, config: RWConfiguration = None, parent_validator_name:str = "", plan: ValidationPlan = None) -> None:
+        if config is None and plan is None:
+            raise AbstractError('ValidationContext requires configuration or validation plan')
         self.parent_validator_name = parent_validator_name
-        self.config: RWConfiguration = config
-        self.fields_annotations = dict((field, self.config.__annotation_generator__.get_annotation(field)) for field in self.config.fields)
-        self.__dataset__ = None
+        self.__config__ = config
+        self.__plan__ = plan
+        # state of configuration is tracked only after it was exposed by .config
+        self.__config_state__ = None
+        self.__config_read__ = False
+        # dataset is stored as list of values indexed by field position and mask of present fields
+        self.__values__ = None
+        self.__mask__ = 0
+        # raw values of fields are kept only by revalidation
+        self.__raw__ = None
 
     @property
-    def dataset(self):
-        if self.__dataset__ is None:
-            raise NativeValidationError(f'value required')
-        else:
-            return self.__dataset__
+    def config(self) -> RWConfiguration:
+        if self.__config__ is None:
+            self.__config__ = self.__plan__.config.to_RW()
+        if self.__config_state__ is None:
+            self.__config_state__ = _config_state(self.__config__)
+        # configuration may be modified locally, so it is compared with compiled state on next use of plan
+        self.__config_read__ = True
+        return self.__config__
+
+    @config.setter
+    def config(self, value: RWConfiguration):
+        self.__config__ = value
+        self.__plan__ = None
+
+    @property
+    def plan(self) -> ValidationPlan:
+        plan = self.__plan__
+        if self.__config_read__:
+            self.__config_read__ = False
+            if plan is not None and not _same_state(_config_state(self.__config__), self.__config_state__):
+                plan = None
+        if plan is None:
+            plan = self.__plan__ = ValidationPlan.compile(self.__config__, self.parent_validator_name)
+            if self.__config_state__ is not None:
+                self.__config_state__ = _config_state(self.__config__)
+        return plan
+
+    @property
+    def fields_annotations(self) -> Dict[ModelField, type]:
+        return self.plan.annotations
+
+    @property
+    def slots(self) -> Tuple[list, int]:
+        if self.__values__ is None:
+            raise NativeValidationError(f'value required', code='required')
+        return self.__values__, self.__mask__
+
+    @slots.setter
+    def slots(self, value: Tuple[list, int]):
+        self.__values__, self.__mask__ = value
+
+    @property
+    def dataset(self) -> dict:
+        values, mask = self.slots
+        return dict((x.field, values[x.index]) for x in self.plan.field_plans if mask & x.bit)
     
     @dataset.setter
-    def dataset(self, value):
+    def dataset(self, value: dict):
         if not isinstance(value, dict):
-            raise NativeValidationError('Invalid typecast. Object required.')
-        else:
-            self.__dataset__ = value
+            raise NativeValidationError('Invalid typecast. Object required.', code='typecast')
+
+        by_field = self.plan.by_field
+        values = [None] * len(by_field)
+        mask = 0
+        for field, item in value.items():
+            field_plan = by_field.get(field)
+            if field_plan is not None:
+                values[field_plan.index] = item
+                mask |= field_plan.bit
+        self.slots = values, mask
 
 
     def __enter__(self):
@@ -155,22 +303,31 @@ class ValidationContext:
     def _deep_execute_on_dataset(self, *, method=None, replace_field=False):
         result = dict()
         method = method if method is not None else lambda x: x
-        for field in self.config.fields:
-            result_field = field.name if replace_field else field
-            if field in self.dataset:    
-                if isinstance(self.dataset[field], ValidationContext):
-                    result[result_field] = method(self.dataset[field])
-                elif (isinstance(self.dataset[field], Iterable)) and not(isinstance(self.dataset[field], dict) or isinstance(self.dataset[field], str)):
-                    result[result_field] = [method(tmp) if isinstance(tmp, ValidationContext) else tmp for tmp in self.dataset[field]]
-                    if isinstance(self.dataset[field], tuple):
+        plan = self.plan
+        missing_value = plan.missing_value
+        values, mask = self.slots
+        for field_plan in plan.field_plans:
+            result_field = field_plan.name if replace_field else field_plan.field
+            if mask & field_plan.bit:
+                value = values[field_plan.index]
+                if field_plan.validator is None:
+                    # nested contexts are results of validators only
+                    result[result_field] = value
+                elif isinstance(value, ValidationContext):
+                    result[result_field] = method(value)
+                elif isinstance(value, LazySequence):
+                    result[result_field] = value.exported(method)
+                elif (isinstance(value, IterableABC)) and not(isinstance(value, dict) or isinstance(value, str)):
+                    result[result_field] = [method(tmp) if isinstance(tmp, ValidationContext) else tmp for tmp in value]
+                    if isinstance(value, tuple):
                         result[result_field] = tuple(result[result_field])
                 else:
-                    result[result_field] = self.dataset[field]
+                    result[result_field] = value
             else:
-                if self.config.missing_value is _EXCLUDE_MISSING:
+                if missing_value is _EXCLUDE_MISSING:
                     continue
                 else:
-                    result[result_field] = self.config.missing_value
+                    result[result_field] = missing_value
         
         return result
 
@@ -182,212 +339,301 @@ class ValidationContext:
 
     def enumerize_dataset(self, dataset: dict):
         if not isinstance(dataset, dict):
-            raise NativeValidationError('Invalid typecast. Object required.')
-        
-        self.dataset = {**dataset}
-
-        result = dict()
-        
-        for field in self.config.fields:
-            if field in self.config.defaults:
-                result[field] = self.config.defaults[field]
-
-            if field.value in self.dataset:
-                result[field] = self.dataset.pop(field.value)
-            elif field in self.dataset:
-                result[field] = self.dataset.pop(field)
+            raise NativeValidationError('Invalid typecast. Object required.', code='typecast')
+
+        plan = self.plan
+        field_plans = plan.field_plans
+        values = [None] * len(field_plans)
+        mask = 0
+        consumed = 0
+        # ModelField keys are looked up only if there are any, because their hashing is slow
+        enumerized = not all(isinstance(key, str) for key in dataset)
+        for field_plan in field_plans:
+            # name of field has priority over ModelField key
+            value = dataset.get(field_plan.name, _NO_VALUE)
+            if value is _NO_VALUE and enumerized:
+                value = dataset.get(field_plan.field, _NO_VALUE)
+            if value is not _NO_VALUE:
+                consumed += 1
+            elif field_plan.has_default:
+                value = field_plan.default
+            else:
+                continue
+            values[field_plan.index] = value
+            mask |= field_plan.bit
 
-        if self.config.raise_unnecessary and (len(self.dataset) > 0):
-            raise ValidationError(f'Given dataset contains unnecessary fields: {[str(x) for x in self.dataset.keys()]}') 
+        if plan.raise_unnecessary and (len(dataset) > consumed):
+            raise ValidationError(f'Given dataset contains unnecessary fields: {[str(x) for x in self._unnecessary_fields(dataset)]}', code='unnecessary')
 
-        self.dataset = result
+        self.slots = values, mask
         return self
 
+    def _unnecessary_fields(self, dataset: dict) -> List[Any]:
+        names = set(x.name for x in self.plan.field_plans)
+        by_field = self.plan.by_field
+        return [key for key in dataset.keys() if not (key in names or (key in by_field and key.value not in dataset))]
+
     def filter_readonly(self, dataset:dict = None,*, raise_readonly = False):
         if dataset is not None:
             self.enumerize_dataset(dataset)
 
-        result = dict()
-
-        for field in self.config.fields:
-            if field in self.dataset:
-                if field in self.config.readonly:
+        values, mask = self.slots
+        plan = self.plan
+        readonly_mask = plan.readonly_mask
+        if mask & readonly_mask:
+            values = list(values)
+            for field_plan in plan.field_plans:
+                if mask & readonly_mask & field_plan.bit:
                     if raise_readonly:
-                        raise ValidationError(f'Given dataset contains read-only field: {field.value}')
-                    else:
-                        continue
-                else:
-                    result[field] = self.dataset.pop(field)
-                
+                        raise ValidationError(f'Given dataset contains read-only field: {field_plan.name}', code='readonly')
+                    values[field_plan.index] = None
+            self.slots = values, mask & ~readonly_mask
 
-        self.dataset = result
         return self
 
     def check_requirements(self, dataset:dict = None):
         if dataset is not None:
             self.filter_readonly(dataset)
 
-        try:
-            self.config.requirements.resolve([x for x in self.dataset.keys()])
-        except FieldRequirementException:
-            raise ValidationError(f'Given dataset does not satisfying the requirements: {self.config.requirements.text_rule()}')
+        plan = self.plan
+        if not plan.requirements_mask(self.slots[1]):
+            raise ValidationError(f'Given dataset does not satisfying the requirements: {plan.requirements_text}', code='requirements')
         return self
 
     def get_annotation(self, field:ModelField):
-        for model_field in fields(self.config.model):
+        for model_field in fields(self.plan.model):
             if model_field.name == field.value:
                 return model_field.type or Any
         else:
             return Any
 
     def any_iterable(self, annotation:type):
-        if str(annotation).startswith('typing.Iterable') or \
-            str(annotation).startswith('typing.List') or \
-            str(annotation).startswith('typing.Tuple') or \
-            annotation is tuple or \
-            annotation is list:
-            return True
-        else:
-            return False
+        return is_array(annotation)
 
     def any_union(self, annotation:type):
-        return str(annotation).startswith('typing.Union')
+        return is_union(annotation)
 
     def find_validator(self, field: ModelField):
-        return self.config.validators.get(field)
+        return self.plan.validators.get(field)
 
     @staticmethod
     def getname(obj):
-        try:
-            return obj._name
-        except AttributeError:
-            try:
-                return obj.__name__
-            except AttributeError:
-                return str(obj)
+        return getname(obj)
 
-            
     def resolve_annotations(self, field:ModelField, annotation:type, value:Any, validator:Validator):
-        tp = TypingModuleValidator()
-        errors = list()
-        native_error = None
-        notnone_error = None
-        if self.any_union(annotation):
-            args = annotation.__args__
-            for arg in args:
-                try:
-                    if arg is type(None) or arg is None:
-                        if value is None:
-                            return None
-                        else:
-                            raise NotNoneError('Value is not None')
-                    else:
-                        return self.resolve_annotations(field, arg, value, validator)
-                except NotNoneError as e:
-                    notnone_error = e
-                    continue
-                except NativeValidationError as e:
-                    native_error = e
-                    continue
-                except ValidationError as e:
-                    errors.append((arg,e))
-                    continue
-            else:
-                if len(errors) > 0:
-                    raise ValidationError(f'{", ".join(f"{self.getname(arg)}({err})" for arg,err in errors)}')
-                else:
-                    raise native_error or notnone_error
-
-        elif self.any_iterable(annotation):
-            if (not isinstance(value, Iterable)) or (isinstance(value, dict)) or (isinstance(value, str)):
-                raise NativeValidationError(f'Invalid typecast. Array required.')
-
-            if tp._is_typing_alias(str(annotation)):
-                result = list()
-                args = annotation.__args__
-                for i, subvalue in enumerate(value):
-                    for arg in args:
-                        try:
-                            result.append(self.resolve_annotations(field, arg, subvalue, validator))
-                            break
-                        except NotNoneError as e:
-                            notnone_error = e
-                            continue
-                        except NativeValidationError as e:
-                            native_error = e
-                            continue
-                        except ValidationError as e:
-                            errors.append((arg,e))
-                            continue
-                    else:
-                        if len(errors) > 0:
-                            raise ValidationError(f'[{i}]: {", ".join(f"({err})" for _, err in errors)}')
-                        else:
-                            raise native_error or notnone_error
-                
-                if str(annotation).startswith('typing.Tuple'):
-                    return tuple(result)
-                else:
-                    return result
-            else: # we does not know about items types
-                return annotation(value)
+        return build_coercer(annotation, validator)(value)
+
+    def field_error(self, field:ModelField, value:Any, e:Exception) -> Exception:
+        if isinstance(e, ValidationError):
+            return e.within((self.parent_validator_name, field))
+        elif isinstance(e, UnexpectedError):
+            return UnexpectedError(f'{self.parent_validator_name}({field}) -> {str(e)}')
         else:
-            if validator:
-                result = validator.validate(value)
-                
-                if validator.check_result_type:
-                    if isinstance(result, ValidationContext):
-                        if annotation != validator.validator.model:
-                            raise AbstractError(f'Field annotation and validator model are different')
-                    elif not tp._is_instance(result, annotation):
-                        raise RuntimeError(f'Invalid typecast after user-defined validation: validator returned {type(result)}, but {str(annotation)} required.')
-                
-                return result
-            else:
-                try:
-                    if value is None:
-                        raise NativeValidationError('value required')
-                    elif (annotation is bool) and isinstance(value, str):
-                        if value.strip().lower() == 'true':
-                            return True
-                        elif value.strip().lower() == 'false':
-                            return False
-                        else:
-                            raise ValueError(f'invalid literal for Boolean: "{value}"')
-                    else:
-                        return annotation(value)
-                except (ValueError, TypeError) as e:
-                    raise ValidationError(f'Invalid typecast: {str(e)}')
-
-                    
+            error = UnexpectedError(f'{self.parent_validator_name}({field}): Unexpected error with value {value}: {str(e)}')
+            error.__cause__ = e
+            return error
+
+    def check_sync(self):
+        if self.plan.is_async:
+            raise AbstractError(f'{self.parent_validator_name} has async validators or combinators. Use avalidate() or amap() instead.')
+
     def validate(self, dataset:dict = None):
+        self.check_sync()
         if dataset is not None:
             self.check_requirements(dataset)
 
-        result = dict()
-        for field, value in self.dataset.items():
+        values, mask = self.slots
+        result = list(values)
+        for field_plan in self.plan.field_plans:
+            if not mask & field_plan.bit:
+                continue
+            value = values[field_plan.index]
+            if field_plan.default_ready and value is field_plan.default:
+                continue
             try:
-                annotation = self.fields_annotations[field]
-                validator = self.find_validator(field)
-                result[field] = self.resolve_annotations(field, annotation, value, validator)
-            except (ValidationError, NativeValidationError) as e:
-                raise ValidationError(f'{self.parent_validator_name}({field}) -> {str(e)}')
-            except UnexpectedError as e:
-                raise UnexpectedError(f'{self.parent_validator_name}({field}) -> {str(e)}')
+                result[field_plan.index] = field_plan.coercer(value)
             except Exception as e:
-                raise UnexpectedError(f'{self.parent_validator_name}({field}): Unexpected error with value {value}: {str(e)}') from e
+                raise self.field_error(field_plan.field, value, e)
             
-        self.dataset = result
+        self.slots = result, mask
+        return self
+
+    def fused(self, dataset: dict):
+        # enumerize_dataset, filter_readonly, check_requirements, validate and combine in one pass over fields.
+        # pure coercers are called in the same pass, their error is raised after requirements like in the chain;
+        # user-defined and nested validators are called only after requirements are satisfied
+        self.check_sync()
+        if not isinstance(dataset, dict):
+            raise NativeValidationError('Invalid typecast. Object required.', code='typecast')
+
+        plan = self.plan
+        field_plans = plan.field_plans
+        values = [None] * len(field_plans)
+        mask = 0
+        consumed = 0
+        deferred = list()
+        error = None
+        enumerized = not all(isinstance(key, str) for key in dataset)
+        for field_plan in field_plans:
+            value = dataset.get(field_plan.name, _NO_VALUE)
+            if value is _NO_VALUE and enumerized:
+                value = dataset.get(field_plan.field, _NO_VALUE)
+            if value is not _NO_VALUE:
+                consumed += 1
+            elif field_plan.has_default:
+                value = field_plan.default
+            else:
+                continue
+            if field_plan.readonly:
+                continue
+
+            mask |= field_plan.bit
+            values[field_plan.index] = value
+            if field_plan.default_ready and value is field_plan.default:
+                continue
+            coercer = field_plan.coercer
+            if not coercer.pure:
+                deferred.append(field_plan)
+            elif error is None:
+                try:
+                    values[field_plan.index] = coercer(value)
+                except Exception as e:
+                    error = field_plan, value, e
+
+        if plan.raise_unnecessary and (len(dataset) > consumed):
+            raise ValidationError(f'Given dataset contains unnecessary fields: {[str(x) for x in self._unnecessary_fields(dataset)]}', code='unnecessary')
+        if not plan.requirements_mask(mask):
+            raise ValidationError(f'Given dataset does not satisfying the requirements: {plan.requirements_text}', code='requirements')
+
+        # errors are raised in order of fields
+        for field_plan in deferred:
+            if error is not None and field_plan.index > error[0].index:
+                break
+            value = values[field_plan.index]
+            try:
+                values[field_plan.index] = field_plan.coercer(value)
+            except Exception as e:
+                raise self.field_error(field_plan.field, value, e)
+        if error is not None:
+            raise self.field_error(error[0].field, error[1], error[2])
+
+        self.slots = values, mask
+        combinators = plan.combinators
+        if combinators:
+            dataset = self.dataset
+            for combinator in combinators:
+                combinator.combine(dataset)
+        return self
+
+    def revalidate(self, previous: Optional['ValidationContext'], dataset: dict):
+        # fields with raw values equal to previous ones are not validated again, their results are reused.
+        # combinators are called only if any of their fields is changed
+        self.check_sync()
+        self.check_requirements(dataset)
+
+        plan = self.plan
+        if previous is None or previous.__raw__ is None or previous.plan is not plan:
+            previous_raw, previous_values, previous_mask = None, None, 0
+        else:
+            previous_raw = previous.__raw__
+            previous_values, previous_mask = previous.slots
+
+        raw, mask = self.slots
+        values = list(raw)
+        snapshot = list(raw)
+        changed = mask ^ previous_mask
+        for field_plan in plan.field_plans:
+            if not mask & field_plan.bit:
+                continue
+            value = raw[field_plan.index]
+            if previous_mask & field_plan.bit and _same_raw(value, previous_raw[field_plan.index]):
+                values[field_plan.index] = previous_values[field_plan.index]
+                snapshot[field_plan.index] = previous_raw[field_plan.index]
+                continue
+            changed |= field_plan.bit
+            snapshot[field_plan.index] = _snapshot(value)
+            if field_plan.default_ready and value is field_plan.default:
+                continue
+            try:
+                values[field_plan.index] = field_plan.coercer(value)
+            except Exception as e:
+                raise self.field_error(field_plan.field, value, e)
+
+        self.slots = values, mask
+        self.__raw__ = snapshot
+        combinators = plan.combinators
+        if combinators:
+            field_bits = plan.field_bits
+            dataset = self.dataset
+            for combinator in combinators:
+                if previous_raw is None or any(changed & field_bits.get(field, 0) for field in combinator.fields):
+                    combinator.combine(dataset)
+        return self
+
+    async def avalidate(self, dataset:dict = None):
+        if dataset is not None:
+            self.check_requirements(dataset)
+
+        values, mask = self.slots
+        result = list(values)
+        present = [x for x in self.plan.field_plans if mask & x.bit]
+        pending = dict()
+        errors = dict()
+        for field_plan in present:
+            value = values[field_plan.index]
+            try:
+                if field_plan.default_ready and value is field_plan.default:
+                    continue
+                elif field_plan.coercer.awaitable:
+                    pending[field_plan.index] = field_plan.coercer.acall(value)
+                else:
+                    result[field_plan.index] = field_plan.coercer(value)
+            except Exception as e:
+                errors[field_plan.index] = e
+
+        # independent fields are validated concurrently, errors are raised in order of fields
+        if pending:
+            for index, outcome in zip(pending.keys(), await asyncio.gather(*pending.values(), return_exceptions=True)):
+                if isinstance(outcome, BaseException):
+                    errors[index] = outcome
+                else:
+                    result[index] = outcome
+
+        for field_plan in present:
+            error = errors.get(field_plan.index)
+            if isinstance(error, Exception):
+                raise self.field_error(field_plan.field, values[field_plan.index], error)
+            elif error is not None:
+                raise error
+
+        self.slots = result, mask
         return self
 
     def combine(self, dataset: dict = None):
         if dataset is not None:
             self.validate(dataset)
+        else:
+            self.check_sync()
 
-        for combinator in self.config.combinators:
-            combinator.combine(self.dataset)
+        combinators = self.plan.combinators
+        if combinators:
+            dataset = self.dataset
+            for combinator in combinators:
+                combinator.combine(dataset)
         
         return self
+
+    async def acombine(self, dataset: dict = None):
+        if dataset is not None:
+            await self.avalidate(dataset)
+
+        combinators = self.plan.combinators
+        if combinators:
+            dataset = self.dataset
+            for combinator in combinators:
+                await combinator.acombine(dataset)
+
+        return self
     
     def validation_entry(self, dataset: dict):
         if dataset is not None:
@@ -405,15 +651,84 @@ class ValidationContext:
     def map(self, dataset:dict = None):
         if dataset is not None:
             self.combine(dataset)
-        return self.config.model(**self._deep_execute_on_dataset(method=lambda x: x.map(), replace_field=True))
+        plan = self.plan
+        constructor = plan.constructor
+        if constructor is not None:
+            result = constructor(*self.slots)
+            if result is not None:
+                return result
+        return plan.model(**self._deep_execute_on_dataset(method=lambda x: x.map(), replace_field=True))
+
+    def profiled(self, dataset: dict, profiler: 'profiling.Profiler', final: str = None):
+        # stages are called one by one, so time of every stage doesn't include previous stages
+        if dataset is None:
+            raise NativeValidationError('value required', code='required')
+        self.check_sync()
+        name = self.parent_validator_name
+        with profiler.recording():
+            profiler.stage(name, 'enumerize_dataset', self.enumerize_dataset, dataset)
+            profiler.stage(name, 'filter_readonly', self.filter_readonly)
+            profiler.stage(name, 'check_requirements', self.check_requirements)
+            profiler.stage(name, 'validate', self._profiled_validate, profiler)
+            profiler.stage(name, 'combine', self.combine)
+            if final is not None:
+                return profiler.stage(name, final, getattr(self, final))
+        return self
+
+    def _profiled_validate(self, profiler: 'profiling.Profiler'):
+        values, mask = self.slots
+        result = list(values)
+        name = self.parent_validator_name
+        for field_plan in self.plan.field_plans:
+            if not mask & field_plan.bit:
+                continue
+            value = values[field_plan.index]
+            if field_plan.default_ready and value is field_plan.default:
+                continue
+            try:
+                result[field_plan.index] = profiler.field(name, field_plan, value)
+            except Exception as e:
+                raise self.field_error(field_plan.field, value, e)
+
+        self.slots = result, mask
+        return self
+
+    async def avalidated_dataset(self, dataset:dict = None):
+        if dataset is not None:
+            await self.acombine(dataset)
+
+        return self.export_dataset()
+
+    async def amap(self, dataset:dict = None):
+        if dataset is not None:
+            await self.acombine(dataset)
+        return self.map()
  
 
 class Outpost(ABCOutpost):
     ...
 
+    @classproperty
+    def plan(class_) -> ValidationPlan:
+        # compiled on first use, so promised validators and model annotations are resolvable at this moment
+        plan = class_.__dict__.get('__plan__')
+        if plan is None:
+            plan = ValidationPlan.compile(class_.__config__, class_.__name__)
+            class_.__plan__ = plan
+        return plan
+
+    @classproperty
+    def engine(class_) -> CodegenEngine:
+        # generated source is available for debugging as .engine.source
+        engine = class_.__dict__.get('__engine__')
+        if engine is None:
+            engine = CodegenEngine(class_.plan, class_.__name__, ValidationContext)
+            class_.__engine__ = engine
+        return engine
+
     @classmethod
     def context(class_) -> ValidationContext:
-        return ValidationContext(class_.__config__.to_RW(), class_.__name__)
+        return ValidationContext(parent_validator_name=class_.__name__, plan=class_.plan)
 
     @classmethod
     @deprecated('Use .update_defaults() instead.')
@@ -430,9 +745,20 @@ class Outpost(ABCOutpost):
 
     @classmethod
     def validate(class_, dataset: dict) -> ValidationContext:
+        profiler = profiling.current
+        if profiler is not None and (profiler.is_recording or profiler.sampled()):
+            return class_.context().profiled(dataset, profiler)
+        return class_._validate(dataset)
+
+    @classmethod
+    def _validate(class_, dataset: dict) -> ValidationContext:
         if dataset is None:
-            raise NativeValidationError('value required')
-        return class_.context().combine(dataset=dataset)
+            raise NativeValidationError('value required', code='required')
+        if class_.plan.codegen and not class_.plan.is_async:
+            ctx = class_.context()
+            ctx.slots = class_.engine.validate(dataset)
+            return ctx
+        return class_.context().fused(dataset)
 
     @classmethod
     @deprecated('Use .validated_dataset() instead.')
@@ -441,7 +767,10 @@ class Outpost(ABCOutpost):
 
     @classmethod
     def validated_dataset(class_, dataset: dict) -> dict:
-        return class_.validate(dataset).validated_dataset()
+        profiler = profiling.current
+        if profiler is not None and (profiler.is_recording or profiler.sampled()):
+            return class_.context().profiled(dataset, profiler, 'export_dataset')
+        return class_._validate(dataset).validated_dataset()
 
     @classmethod
     @deprecated('Use .map() instead.')
@@ -450,7 +779,182 @@ class Outpost(ABCOutpost):
 
     @classmethod
     def map(class_, dataset:dict) -> Any:
-        return class_.validate(dataset).map()
+        profiler = profiling.current
+        if profiler is not None and (profiler.is_recording or profiler.sampled()):
+            return class_.context().profiled(dataset, profiler, 'map')
+        if class_.plan.codegen and not class_.plan.is_async:
+            if dataset is None:
+                raise NativeValidationError('value required', code='required')
+            return class_.engine.map(dataset)
+        return class_._validate(dataset).map()
+
+    @classmethod
+    def revalidate(class_, previous: Optional[ValidationContext], dataset: dict) -> ValidationContext:
+        # first call is made with previous=None, result of each call is previous for the next one
+        if dataset is None:
+            raise NativeValidationError('value required', code='required')
+        return class_.context().revalidate(previous, dataset)
+
+    @classmethod
+    def cache_info(class_) -> Dict[ModelField, Any]:
+        # stats of cached field validators: config.validator(field, cache=N)
+        return dict((field, validator.cache.info()) for field, validator in class_.validators.items() if validator.cache is not None)
+
+    @classmethod
+    async def avalidate(class_, dataset: dict) -> ValidationContext:
+        # generated code is synchronous, so async validation is always interpreted
+        if dataset is None:
+            raise NativeValidationError('value required', code='required')
+        return await class_.context().acombine(dataset=dataset)
+
+    @classmethod
+    async def avalidated_dataset(class_, dataset: dict) -> dict:
+        return (await class_.avalidate(dataset)).validated_dataset()
+
+    @classmethod
+    async def amap(class_, dataset: dict) -> Any:
+        return (await class_.avalidate(dataset)).map()
+
+    @classmethod
+    def _nested_handler(class_) -> Callable[[dict], ValidationContext]:
+        # items of nested arrays are validated with plan and engine resolved once for whole array
+        plan = class_.plan
+        name = class_.__name__
+        engine = class_.engine if plan.codegen and not plan.is_async else None
+
+        def handler(dataset: dict):
+            if dataset is None:
+                raise NativeValidationError('value required', code='required')
+            ctx = ValidationContext(parent_validator_name=name, plan=plan)
+            profiler = profiling.current
+            if profiler is not None and profiler.is_recording:
+                return ctx.profiled(dataset, profiler)
+            if engine is not None:
+                ctx.slots = engine.validate(dataset)
+                return ctx
+            return ctx.fused(dataset)
+
+        return handler
+
+    @classmethod
+    def _batch_handler(class_, export: bool, strict: bool = False) -> Callable[[dict], Any]:
+        # one context is reused for all rows of the batch: every stage replaces its dataset.
+        # strict handler validates lazy arrays at once, so their errors are reported for the row that contains them
+        ctx = class_.context()
+        engine = class_.engine if class_.plan.codegen and not class_.plan.is_async else None
+        lazy = strict and any(x.validator is not None and x.validator.lazy for x in class_.plan.field_plans)
+
+        def handler(dataset: dict):
+            if dataset is None:
+                raise NativeValidationError('value required', code='required')
+            try:
+                if engine is not None:
+                    if not (export or lazy):
+                        return engine.map(dataset)
+                    ctx.slots = engine.validate(dataset)
+                else:
+                    ctx.fused(dataset)
+                if lazy:
+                    for value in ctx.slots[0]:
+                        if isinstance(value, LazySequence):
+                            value.validate_all()
+                return ctx.export_dataset() if export else ctx.map()
+            except (ValidationError, UnexpectedError, AbstractError):
+                raise
+            except Exception as e:
+                # model may fail to be constructed from valid dataset (required field not covered by requirements),
+                # such row is reported as failed, the rest of batch is processed
+                raise UnexpectedError(f'{class_.__name__}: Unexpected error on model construction: {str(e)}') from e
+
+        return handler
+
+    @classmethod
+    def _context_handler(class_) -> Callable[[dict], ValidationContext]:
+        # like batch handler, but returns validated context, so presence of fields is known by its mask
+        ctx = class_.context()
+        engine = class_.engine if class_.plan.codegen and not class_.plan.is_async else None
+
+        def handler(dataset: dict):
+            if dataset is None:
+                raise NativeValidationError('value required', code='required')
+            if engine is not None:
+                ctx.slots = engine.validate(dataset)
+            else:
+                ctx.fused(dataset)
+            return ctx
+
+        return handler
+
+    @classmethod
+    def _run_many(class_, datasets: Iterable[dict], export: bool, workers: Optional[int], chunk_size: int, executor: Optional[Executor]) -> BatchResult:
+        if workers is None and executor is None:
+            return run_batch(datasets, class_._batch_handler(export=export))
+
+        if executor is not None:
+            return run_parallel(class_, datasets, export, executor, chunk_size, window=2 * (workers or 1))
+
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            return run_parallel(class_, datasets, export, executor, chunk_size, window=2 * workers)
+
+    @classmethod
+    def map_many(class_, datasets: Iterable[dict], *, workers: int = None, chunk_size: int = 1000, executor: Executor = None) -> BatchResult:
+        return class_._run_many(datasets, False, workers, chunk_size, executor)
+
+    @classmethod
+    def validated_dataset_many(class_, datasets: Iterable[dict], *, workers: int = None, chunk_size: int = 1000, executor: Executor = None) -> BatchResult:
+        return class_._run_many(datasets, True, workers, chunk_size, executor)
+
+    @classmethod
+    def ingest(class_, datasets: Iterable[dict], bind: Any, *, batch_size: int = 1000, on_error: Callable[[RowError], Any] = None) -> Any:
+        # sqlalchemy is optional, so ingestion is imported only when used
+        from .alchemy import ingest
+        return ingest(class_, datasets, bind, batch_size=batch_size, on_error=on_error)
+
+    @classmethod
+    def _iter_source(class_, source: Iterable, format: Optional[str], export: bool, **kwargs) -> Iterator[Union[Any, RowError]]:
+        records, decode = iter_records(source, class_.fields, format, **kwargs)
+        handler = class_._batch_handler(export=export)
+        return iter_batch(records, lambda record: handler(decode(record)))
+
+    @classmethod
+    def _from_json(class_, data: Union[str, bytes, bytearray, memoryview], export: bool, encoding: str) -> Any:
+        text = json_text(data, encoding)
+        start = json_start(text)
+        if text.startswith('[', start):
+            return iter_batch(json_array_items(text, start), class_._batch_handler(export=export))
+        dataset = decode_json(text, start)
+        return class_.validated_dataset(dataset) if export else class_.map(dataset)
+
+    @classmethod
+    def map_json(class_, data: Union[str, bytes, bytearray, memoryview], *, encoding: str = 'utf-8') -> Any:
+        # top-level array is validated incrementally: iterator of models and RowError of invalid items
+        return class_._from_json(data, export=False, encoding=encoding)
+
+    @classmethod
+    def validated_dataset_json(class_, data: Union[str, bytes, bytearray, memoryview], *, encoding: str = 'utf-8') -> Any:
+        return class_._from_json(data, export=True, encoding=encoding)
+
+    @classmethod
+    def dump(class_, model: Any) -> Any:
+        # mapped model, validated dataset or array of them to dict of JSON compatible values
+        return class_.plan.dumper(model)
+
+    @classmethod
+    def dump_json(class_, model: Any) -> str:
+        return dump_json(class_.plan.dumper(model))
+
+    @classmethod
+    def validate_columns(class_, columns: Any) -> ColumnarResult:
+        # requires numpy
+        return validate_columns(class_.plan, class_.__name__, columns)
+
+    @classmethod
+    def iter_map(class_, source: Iterable, format: Optional[str] = None, **kwargs) -> Iterator[Union[Any, RowError]]:
+        return class_._iter_source(source, format, export=False, **kwargs)
+
+    @classmethod
+    def iter_validated(class_, source: Iterable, format: Optional[str] = None, **kwargs) -> Iterator[Union[dict, RowError]]:
+        return class_._iter_source(source, format, export=True, **kwargs)
 
     def __call__(self, *_: Any, **__: Any) -> Any:
         raise AbstractError(f'{self.__class__.__name__} is for static usage only')